@@ -1,5 +1,6 @@
 import os
 
+from zhenxun.builtin_plugins.help._utils import invalidate_plugin_cache
 from zhenxun.configs.path_config import DATA_PATH, IMAGE_PATH
 from zhenxun.models.group_console import GroupConsole
 from zhenxun.models.plugin_info import PluginInfo
@@ -15,6 +16,7 @@ GROUP_HELP_PATH = DATA_PATH / "group_help"
 
 def delete_help_image(gid: str | None = None):
     """删除帮助图片"""
+    invalidate_plugin_cache()
     if gid:
         for file in os.listdir(GROUP_HELP_PATH):
             if file.startswith(f"{gid}"):
@@ -1,5 +1,8 @@
+import asyncio
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from io import BytesIO
+import time
 
 from nonebot.plugin import PluginMetadata
 from nonebot_plugin_alconna import (
@@ -18,7 +21,6 @@ import pytz
 from zhenxun.configs.config import Config
 from zhenxun.configs.utils import Command, PluginExtraData, RegisterConfig
 from zhenxun.models.chat_history import ChatHistory
-from zhenxun.models.group_member_info import GroupInfoUser
 from zhenxun.services.log import logger
 from zhenxun.utils.enum import PluginType
 from zhenxun.utils.image_utils import BuildImage, ImageTemplate
@@ -71,6 +73,51 @@ __plugin_meta__ = PluginMetadata(
 )
 
 
+_AVATAR_CACHE_TTL = 3600
+_AVATAR_CACHE_SIZE = 256
+
+_avatar_cache: OrderedDict[tuple[str, str], tuple[float, bytes | None]] = OrderedDict()
+
+
+async def _cached_avatar(uid: str) -> bytes | None:
+    """带TTL缓存的头像获取，重复渲染排行时避免反复下载
+
+    参数:
+        uid: 用户id
+
+    返回:
+        bytes | None: 头像数据
+    """
+    key = ("qq", uid)
+    now = time.time()
+    if hit := _avatar_cache.get(key):
+        if now - hit[0] < _AVATAR_CACHE_TTL:
+            _avatar_cache.move_to_end(key)
+            return hit[1]
+    data = await PlatformUtils.get_user_avatar(uid, "qq")
+    _avatar_cache[key] = (now, data)
+    _avatar_cache.move_to_end(key)
+    while len(_avatar_cache) > _AVATAR_CACHE_SIZE:
+        _avatar_cache.popitem(last=False)
+    return data
+
+
+_PLACEHOLDER_AVATAR: tuple[BuildImage, int, int] | None = None
+_placeholder_lock = asyncio.Lock()
+
+
+async def _get_placeholder_avatar(size: int = 40) -> tuple[BuildImage, int, int]:
+    """懒加载并缓存缺失头像的灰色圆形占位图"""
+    global _PLACEHOLDER_AVATAR
+    if _PLACEHOLDER_AVATAR is None:
+        async with _placeholder_lock:
+            if _PLACEHOLDER_AVATAR is None:
+                placeholder_img = BuildImage(size, size, color="#CCCCCC")
+                await placeholder_img.circle()
+                _PLACEHOLDER_AVATAR = (placeholder_img, size, size)
+    return _PLACEHOLDER_AVATAR
+
+
 _matcher = on_alconna(
     Alconna(
         "消息排行",
@@ -83,7 +130,7 @@ _matcher = on_alconna(
 )
 
 _matcher.shortcut(
-    r"(?P<type>['日', '周', '月', '季', '年'])?消息(排行|统计)\s?(?P<cnt>\d+)?",
+    r"(?P<type>[日周月季年])?消息(排行|统计)\s?(?P<cnt>\d+)?",
     command="消息排行",
     arguments=["{type}", "{cnt}"],
     prefix=True,
@@ -120,46 +167,41 @@ async def _(
     if not show_quit_member:
         fetch_count = count.result * 2
 
-    if rank_data := await ChatHistory.get_group_msg_rank(
+    if rank_data := await ChatHistory.get_group_msg_rank_with_name(
         group_id, fetch_count, "DES" if arparma.find("des") else "DESC", date_scope
     ):
         idx = 1
         data_list = []
+        avatar_size = 40
+
+        avatars = await asyncio.gather(
+            *[_cached_avatar(str(uid)) for uid, _, _ in rank_data],
+            return_exceptions=True,
+        )
+
+        placeholder_tuple = await _get_placeholder_avatar(avatar_size)
 
-        for uid, num in rank_data:
+        for (uid, num, member_name), avatar_bytes in zip(rank_data, avatars):
             if len(data_list) >= count.result:
                 break
 
-            user_in_group = await GroupInfoUser.filter(
-                user_id=uid, group_id=group_id
-            ).first()
-
-            if not user_in_group and not show_quit_member:
+            # member_name 为 None 表示无群成员记录（已退群），空字符串是有效昵称
+            if member_name is None and not show_quit_member:
                 continue
 
-            if user_in_group:
-                user_name = user_in_group.user_name
-            else:
-                user_name = f"{uid}(已退群)"
-
-            avatar_size = 40
-            try:
-                avatar_bytes = await PlatformUtils.get_user_avatar(str(uid), "qq")
-                if avatar_bytes:
-                    avatar_img = BuildImage(
-                        avatar_size, avatar_size, background=BytesIO(avatar_bytes)
-                    )
-                    await avatar_img.circle()
-                    avatar_tuple = (avatar_img, avatar_size, avatar_size)
-                else:
-                    avatar_img = BuildImage(avatar_size, avatar_size, color="#CCCCCC")
-                    await avatar_img.circle()
-                    avatar_tuple = (avatar_img, avatar_size, avatar_size)
-            except Exception as e:
-                logger.warning(f"获取用户头像失败: {e}", "chat_history")
-                avatar_img = BuildImage(avatar_size, avatar_size, color="#CCCCCC")
+            user_name = member_name if member_name is not None else f"{uid}(已退群)"
+
+            if isinstance(avatar_bytes, BaseException):
+                logger.warning(f"获取用户头像失败: {avatar_bytes}", "chat_history")
+                avatar_bytes = None
+            if avatar_bytes:
+                avatar_img = BuildImage(
+                    avatar_size, avatar_size, background=BytesIO(avatar_bytes)
+                )
                 await avatar_img.circle()
                 avatar_tuple = (avatar_img, avatar_size, avatar_size)
+            else:
+                avatar_tuple = placeholder_tuple
 
             data_list.append([idx, avatar_tuple, user_name, num])
             idx += 1
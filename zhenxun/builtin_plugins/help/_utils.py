@@ -1,31 +1,60 @@
+import asyncio
 from collections.abc import Callable
 
 from nonebot_plugin_uninfo import Uninfo
+from tortoise.signals import post_delete, post_save
 
 from zhenxun.models.bot_console import BotConsole
 from zhenxun.models.group_console import GroupConsole
 from zhenxun.models.plugin_info import PluginInfo
 from zhenxun.utils.enum import PluginType
 
+_plugin_cache: list[PluginInfo] | None = None
+_plugin_cache_lock = asyncio.Lock()
+
+
+def invalidate_plugin_cache(*_args, **_kwargs):
+    """失效帮助插件列表缓存，插件信息变动时调用"""
+    global _plugin_cache
+    _plugin_cache = None
+
+
+async def _invalidate_plugin_cache_listener(*args, **kwargs):
+    """Tortoise信号监听器会被await，需为协程"""
+    invalidate_plugin_cache(*args, **kwargs)
+
+
+post_save(PluginInfo)(_invalidate_plugin_cache_listener)
+post_delete(PluginInfo)(_invalidate_plugin_cache_listener)
+
+
+def _menu_type(plugin: PluginInfo) -> str:
+    menu_type = plugin.menu_type or "normal"
+    return "功能" if menu_type == "normal" else menu_type
+
+
+async def _fetch_plugins() -> list[PluginInfo]:
+    """获取帮助展示的插件列表，插件信息变动前使用缓存"""
+    global _plugin_cache
+    if _plugin_cache is None:
+        async with _plugin_cache_lock:
+            if _plugin_cache is None:
+                _plugin_cache = await PluginInfo.filter(
+                    menu_type__not="",
+                    load_status=True,
+                    plugin_type__in=[PluginType.NORMAL, PluginType.DEPENDANT],
+                    is_show=True,
+                )
+    return _plugin_cache
+
 
 async def sort_type() -> dict[str, list[PluginInfo]]:
     """
     对插件按照菜单类型分类
     """
-    data = await PluginInfo.filter(
-        menu_type__not="",
-        load_status=True,
-        plugin_type__in=[PluginType.NORMAL, PluginType.DEPENDANT],
-        is_show=True,
-    )
-    sort_data = {}
-    for plugin in data:
-        menu_type = plugin.menu_type or "normal"
-        if menu_type == "normal":
-            menu_type = "功能"
-        if not sort_data.get(menu_type):
-            sort_data[menu_type] = []
-        sort_data[menu_type].append(plugin)
+    sort_data: dict[str, list[PluginInfo]] = {}
+    for plugin in await _fetch_plugins():
+        sort_data.setdefault(_menu_type(plugin), []).append(plugin)
     return sort_data
 
 
@@ -43,13 +72,16 @@ async def classify_plugin(
     返回:
         dict[str, list[Item]]: 分类插件数据
     """
-    sort_data = await sort_type()
     classify: dict[str, list] = {}
-    group = await GroupConsole.get_or_none(group_id=group_id) if group_id else None
-    bot = await BotConsole.get_or_none(bot_id=session.self_id)
-    for menu, value in sort_data.items():
-        for plugin in value:
-            if not classify.get(menu):
-                classify[menu] = []
-            classify[menu].append(handle(bot, plugin, group, is_detail))
+    plugins, group, bot = await asyncio.gather(
+        _fetch_plugins(),
+        GroupConsole.get_or_none(group_id=group_id)
+        if group_id
+        else asyncio.sleep(0, result=None),
+        BotConsole.get_or_none(bot_id=session.self_id),
+    )
+    for plugin in plugins:
+        classify.setdefault(_menu_type(plugin), []).append(
+            handle(bot, plugin, group, is_detail)
+        )
     return classify
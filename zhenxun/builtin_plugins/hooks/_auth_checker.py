@@ -19,11 +19,15 @@ from zhenxun.models.sign_user import SignUser
 from zhenxun.models.user_console import UserConsole
 from zhenxun.services.log import logger
 from zhenxun.utils.enum import (
-    BlockType,
+    BT_ALL,
+    BT_GROUP,
+    BT_PRIVATE,
+    PT_DEPENDANT,
+    PT_HIDDEN,
+    PT_SUPERUSER,
     GoldHandle,
     LimitWatchType,
     PluginLimitType,
-    PluginType,
 )
 from zhenxun.utils.exception import InsufficientGold
 from zhenxun.utils.message import MessageUtils
@@ -209,7 +213,7 @@ class AuthChecker:
         """
         if not base_config.get("IS_SEND_TIP_MESSAGE"):
             return False
-        if plugin.plugin_type == PluginType.DEPENDANT:
+        if plugin.plugin_type == PT_DEPENDANT:
             return False
         if plugin.ignore_prompt:
             return False
@@ -254,7 +258,7 @@ class AuthChecker:
                 )
                 return
             if plugin := await PluginInfo.get_or_none(module_path=module_path):
-                if plugin.plugin_type == PluginType.HIDDEN:
+                if plugin.plugin_type == PT_HIDDEN:
                     logger.debug(
                         f"插件: {plugin.name}:{plugin.module} "
                         "为HIDDEN，已跳过权限检查..."
@@ -263,7 +267,7 @@ class AuthChecker:
                 try:
                     cost_gold = await self.auth_cost(user, plugin, session)
                     if session.id1 in bot.config.superusers:
-                        if plugin.plugin_type == PluginType.SUPERUSER:
+                        if plugin.plugin_type == PT_SUPERUSER:
                             raise IsSuperuserException()
                         if not plugin.limit_superuser:
                             cost_gold = 0
@@ -406,7 +410,7 @@ class AuthChecker:
                         session=session,
                     )
                     raise IgnoredException("该群未开启此功能...")
-                if plugin.block_type == BlockType.GROUP:
+                if plugin.block_type == BT_GROUP:
                     """全局群组禁用"""
                     try:
                         if self.is_send_limit_message(plugin, sid):
@@ -429,7 +433,7 @@ class AuthChecker:
                     raise IgnoredException("该插件在群组中已被禁用...")
             else:
                 sid = user_id
-                if plugin.block_type == BlockType.PRIVATE:
+                if plugin.block_type == BT_PRIVATE:
                     """全局私聊禁用"""
                     try:
                         if self.is_send_limit_message(plugin, sid):
@@ -450,7 +454,7 @@ class AuthChecker:
                         session=session,
                     )
                     raise IgnoredException("该插件在私聊中已被禁用...")
-            if not plugin.status and plugin.block_type == BlockType.ALL:
+            if not plugin.status and plugin.block_type == BT_ALL:
                 """全局状态"""
                 if group_id and await GroupConsole.is_super_group(group_id):
                     raise IsSuperuserException()
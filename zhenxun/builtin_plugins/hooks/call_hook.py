@@ -1,5 +1,9 @@
+import asyncio
+import contextlib
+from functools import lru_cache
 from typing import Any
 
+import nonebot
 from nonebot.adapters import Bot, Message
 
 from zhenxun.configs.config import Config
@@ -7,9 +11,86 @@ from zhenxun.models.bot_message_store import BotMessageStore
 from zhenxun.services.log import logger
 from zhenxun.utils.enum import BotSentType
 from zhenxun.utils.manager.message_manager import MessageManager
+from zhenxun.utils.manager.priority_manager import PriorityLifecycle
 from zhenxun.utils.platform import PlatformUtils
 
 
+@lru_cache(maxsize=1)
+def _record_enabled() -> bool:
+    """缓存消息记录开关，配置重载时失效"""
+    return bool(Config.get_config("hook", "RECORD_BOT_SENT_MESSAGES"))
+
+
+Config.add_reload_listener(_record_enabled.cache_clear)
+
+
+_FLUSH_INTERVAL = 0.1
+_FLUSH_BATCH_SIZE = 200
+
+_pending: list[BotMessageStore] = []
+_flush_event = asyncio.Event()
+
+
+async def _flush_writer():
+    """后台批量写入发送消息记录，将逐条INSERT合并为批量INSERT"""
+    while True:
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(_flush_event.wait(), timeout=_FLUSH_INTERVAL)
+        _flush_event.clear()
+        if not _pending:
+            continue
+        batch = _pending.copy()
+        _pending.clear()
+        try:
+            await BotMessageStore.bulk_create(batch, batch_size=500)
+        except Exception as e:
+            logger.warning("消息发送记录批量写入失败", "msg_hook", e=e)
+
+
+_writer_task: asyncio.Task | None = None
+
+
+@PriorityLifecycle.on_startup(priority=5)
+async def _():
+    global _writer_task
+    _writer_task = asyncio.create_task(_flush_writer())
+
+
+@nonebot.get_driver().on_shutdown
+async def _flush_pending_on_shutdown():
+    """停止写入任务并落盘剩余记录，避免关闭时丢弃缓冲中的消息"""
+    if _writer_task:
+        _writer_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _writer_task
+    if _pending:
+        batch = _pending.copy()
+        _pending.clear()
+        try:
+            await BotMessageStore.bulk_create(batch, batch_size=500)
+        except Exception as e:
+            logger.warning("关闭时写入剩余消息记录失败", "msg_hook", e=e)
+
+
+_platform_cache: dict[str, str] = {}
+
+
+def _platform_for(bot: Bot) -> str:
+    """按bot缓存平台解析结果"""
+    if platform := _platform_cache.get(bot.self_id):
+        return platform
+    return _platform_cache.setdefault(bot.self_id, PlatformUtils.get_platform(bot))
+
+
+_SEGMENT_HANDLERS = {
+    "at": lambda data: f"@{data['qq']}",
+    "image": lambda _: "[image]",
+    "record": lambda _: "[record]",
+    "face": lambda data: f"[face:{data['id']}]",
+    "reply": lambda _: "",
+}
+
+
 def replace_message(message: Message) -> str:
     """将消息中的at、image、record、face替换为字符串
 
@@ -19,23 +100,15 @@ def replace_message(message: Message) -> str:
     返回:
         str: 文本消息
     """
-    result = ""
+    parts = []
     for msg in message:
         if isinstance(msg, str):
-            result += msg
-        elif msg.type == "at":
-            result += f"@{msg.data['qq']}"
-        elif msg.type == "image":
-            result += "[image]"
-        elif msg.type == "record":
-            result += "[record]"
-        elif msg.type == "face":
-            result += f"[face:{msg.data['id']}]"
-        elif msg.type == "reply":
-            result += ""
+            parts.append(msg)
+        elif handler := _SEGMENT_HANDLERS.get(msg.type):
+            parts.append(handler(msg.data))
         else:
-            result += str(msg)
-    return result
+            parts.append(str(msg))
+    return "".join(parts)
 
 
 @Bot.on_called_api
@@ -60,22 +133,27 @@ async def handle_api_result(
         logger.warning(
             f"收集消息id发生错误...data: {data}, result: {result}", "msg_hook", e=e
         )
-    if not Config.get_config("hook", "RECORD_BOT_SENT_MESSAGES"):
+    if not _record_enabled():
         return
     try:
-        await BotMessageStore.create(
-            bot_id=bot.self_id,
-            user_id=user_id,
-            group_id=group_id,
-            sent_type=BotSentType.GROUP
-            if message_type == "group"
-            else BotSentType.PRIVATE,
-            text=replace_message(message),
-            plain_text=message.extract_plain_text()
-            if isinstance(message, Message)
-            else replace_message(message),
-            platform=PlatformUtils.get_platform(bot),
+        text = replace_message(message)
+        _pending.append(
+            BotMessageStore(
+                bot_id=bot.self_id,
+                user_id=user_id,
+                group_id=group_id,
+                sent_type=BotSentType.GROUP
+                if message_type == "group"
+                else BotSentType.PRIVATE,
+                text=text,
+                plain_text=message.extract_plain_text()
+                if isinstance(message, Message)
+                else text,
+                platform=_platform_for(bot),
+            )
         )
+        if len(_pending) >= _FLUSH_BATCH_SIZE:
+            _flush_event.set()
         logger.debug(f"消息发送记录，message: {message}")
     except Exception as e:
         logger.warning(
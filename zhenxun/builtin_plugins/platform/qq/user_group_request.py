@@ -36,6 +36,15 @@ __plugin_meta__ = PluginMetadata(
 )
 
 
+async def _delayed_ack(bot: Bot, user_id: str, fid: int):
+    """延迟发送申请回执，不占用当前事件处理"""
+    await asyncio.sleep(random.randint(1, 5))
+    await bot.send_private_msg(
+        user_id=int(user_id),
+        message=f"已发送申请，请等待管理员审核，ID：{fid}。",
+    )
+
+
 _matcher = on_alconna(
     Alconna(
         "申请入群",
@@ -75,24 +84,25 @@ async def _(
         nickname=uname,
         group_id=str(group_id),
     )
-    results = await PlatformUtils.send_superuser(
-        bot,
-        f"*****一份入群申请*****\n"
-        f"ID：{f.id}\n"
-        f"申请人：{uname}({session.user.id})\n群聊："
-        f"{group_id}\n邀请日期：{datetime.now().replace(microsecond=0)}\n"
-        "注：该请求为手动申请入群",
+    notify_task = asyncio.create_task(
+        PlatformUtils.send_superuser(
+            bot,
+            f"*****一份入群申请*****\n"
+            f"ID：{f.id}\n"
+            f"申请人：{uname}({session.user.id})\n群聊："
+            f"{group_id}\n邀请日期：{datetime.now().replace(microsecond=0)}\n"
+            "注：该请求为手动申请入群",
+        )
     )
+    asyncio.create_task(  # noqa: RUF006
+        _delayed_ack(bot, session.user.id, f.id)
+    )
+    results = await notify_task
     if message_ids := [
         str(r[1].msg_ids[0]["message_id"]) for r in results if r[1] and r[1].msg_ids
     ]:
         f.message_ids = ",".join(message_ids)
         await f.save(update_fields=["message_ids"])
-    await asyncio.sleep(random.randint(1, 5))
-    await bot.send_private_msg(
-        user_id=int(session.user.id),
-        message=f"已发送申请，请等待管理员审核，ID：{f.id}。",
-    )
     logger.info(
         f"用户 {uname}({session.user.id}) 申请入群 {group_id}，ID：{f.id}。",
         arparma.header_result,
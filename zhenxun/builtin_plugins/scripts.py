@@ -8,23 +8,31 @@ async def _():
     _, is_create = await GroupConsole.get_or_create(group_id=133133133)
     """标记"""
     if is_create:
-        data_list = []
-        for group in await GroupConsole.all():
+
+        def convert(block_str: str) -> str:
+            result = "".join(
+                f"{module}," if module.startswith("<") else f"<{module},"
+                for module in block_str.split(",")
+                if module.strip()
+            )
+            return result.replace("<,", "")
+
+        changed = []
+        for group in await GroupConsole.all().only(
+            "id", "block_plugin", "block_task"
+        ):
+            is_changed = False
             if group.block_plugin:
-                if modules := group.block_plugin.split(","):
-                    block_plugin = "".join(
-                        (f"{module}," if module.startswith("<") else f"<{module},")
-                        for module in modules
-                        if module.strip()
-                    )
-                    group.block_plugin = block_plugin.replace("<,", "")
+                block_plugin = convert(group.block_plugin)
+                if block_plugin != group.block_plugin:
+                    group.block_plugin = block_plugin
+                    is_changed = True
             if group.block_task:
-                if modules := group.block_task.split(","):
-                    block_task = "".join(
-                        (f"{module}," if module.startswith("<") else f"<{module},")
-                        for module in modules
-                        if module.strip()
-                    )
-                    group.block_task = block_task.replace("<,", "")
-            data_list.append(group)
-        await GroupConsole.bulk_update(data_list, ["block_plugin", "block_task"], 10)
+                block_task = convert(group.block_task)
+                if block_task != group.block_task:
+                    group.block_task = block_task
+                    is_changed = True
+            if is_changed:
+                changed.append(group)
+        if changed:
+            await GroupConsole.bulk_update(changed, ["block_plugin", "block_task"], 10)
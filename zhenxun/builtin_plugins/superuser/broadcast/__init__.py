@@ -1,5 +1,4 @@
 from arclet.alconna import AllParam
-from nepattern import UnionPattern
 from nonebot.adapters import Bot, Event
 from nonebot.permission import SUPERUSER
 from nonebot.plugin import PluginMetadata
@@ -10,22 +9,6 @@ from nonebot_plugin_alconna import (
     Args,
     on_alconna,
 )
-from nonebot_plugin_alconna.uniseg.segment import (
-    At,
-    AtAll,
-    Audio,
-    Button,
-    Emoji,
-    File,
-    Hyper,
-    Image,
-    Keyboard,
-    Reference,
-    Reply,
-    Text,
-    Video,
-    Voice,
-)
 from nonebot_plugin_session import EventSession
 
 from zhenxun.configs.utils import PluginExtraData, RegisterConfig, Task
@@ -87,28 +70,6 @@ __plugin_meta__ = PluginMetadata(
     ).to_dict(),
 )
 
-AnySeg = (
-    UnionPattern(
-        [
-            Text,
-            Image,
-            At,
-            AtAll,
-            Audio,
-            Video,
-            File,
-            Emoji,
-            Reply,
-            Reference,
-            Hyper,
-            Button,
-            Keyboard,
-            Voice,
-        ]
-    )
-    @ "AnySeg"
-)
-
 _matcher = on_alconna(
     Alconna(
         "广播",
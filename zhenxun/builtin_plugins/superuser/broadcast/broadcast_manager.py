@@ -1,8 +1,10 @@
 import asyncio
-import random
-import traceback
+import hashlib
+import time
 from typing import ClassVar
+import weakref
 
+import nonebot
 from nonebot.adapters import Bot
 from nonebot.adapters.onebot.v11 import Bot as V11Bot
 from nonebot.exception import ActionFailed
@@ -19,62 +21,130 @@ from .models import BroadcastDetailResult, BroadcastResult
 from .utils import custom_nodes_to_v11_nodes, uni_message_to_v11_list_of_dicts
 
 
+def _is_debug_enabled() -> bool:
+    """判断当前日志级别是否会输出DEBUG，避免在热路径上白白格式化日志内容"""
+    try:
+        level = nonebot.get_driver().config.log_level or "INFO"
+    except Exception:
+        return True
+    if isinstance(level, int):
+        return level <= 10
+    return str(level).upper() in {"TRACE", "DEBUG"}
+
+
+_DEBUG_ENABLED = _is_debug_enabled()
+
+_session_info_cache: dict[int, str] = {}
+"""会话信息字符串缓存，键为会话对象id，随会话回收自动清理"""
+
+_last_broadcast_msg_ids: dict[str, int] = {}
+"""最近一次广播的消息ID记录，群组key -> 消息ID"""
+
+
+def _cache_session_info(session: EventSession, info: str) -> None:
+    key = id(session)
+    try:
+        weakref.finalize(session, _session_info_cache.pop, key, None)
+    except TypeError:
+        return
+    _session_info_cache[key] = info
+
+
 class BroadcastManager:
     """广播管理器"""
 
-    _last_broadcast_msg_ids: ClassVar[dict[str, int]] = {}
+    CONCURRENCY: ClassVar[int] = 5
+    """单次广播并发发送上限"""
+
+    CHUNK_SIZE: ClassVar[int] = 20
+    """合并转发分批发送的批大小"""
+
+    SEND_RATE: ClassVar[float] = 2.0
+    """目标平均发送速率（条/秒）"""
+
+    SEND_BURST: ClassVar[int] = 5
+    """令牌桶容量，允许的瞬时突发发送数"""
+
+    _tokens: ClassVar[float] = float(SEND_BURST)
+    _last_refill: ClassVar[float] = 0.0
+    _throttle_lock: ClassVar[asyncio.Lock] = asyncio.Lock()
+
+    _msg_ids_lock: ClassVar[asyncio.Lock] = asyncio.Lock()
+    """并发广播间保护消息ID记录的锁，发送任务自身只返回结果，合并统一在聚合阶段完成"""
+
+    _inflight: ClassVar[dict[str, "asyncio.Future[BroadcastResult]"]] = {}
+    """进行中的广播，按内容哈希去重，重复触发时等待首个结果"""
+
+    @classmethod
+    async def _acquire_send_token(cls) -> None:
+        """按令牌桶限速，维持全局平均发送速率而非逐条固定延迟"""
+        async with cls._throttle_lock:
+            now = time.monotonic()
+            cls._tokens = min(
+                float(cls.SEND_BURST),
+                cls._tokens + (now - cls._last_refill) * cls.SEND_RATE,
+            )
+            cls._last_refill = now
+            if cls._tokens < 1.0:
+                await asyncio.sleep((1.0 - cls._tokens) / cls.SEND_RATE)
+                cls._last_refill = time.monotonic()
+                cls._tokens = 1.0
+            cls._tokens -= 1.0
 
     @staticmethod
-    def _get_session_info(session: EventSession | None) -> str:
-        """获取会话信息字符串"""
+    def _get_session_info(session: EventSession | str | None) -> str:
+        """获取会话信息字符串，同一会话对象只格式化一次"""
         if not session:
             return ""
+        if isinstance(session, str):
+            return session
+        if (cached := _session_info_cache.get(id(session))) is not None:
+            return cached
 
         try:
             platform = getattr(session, "platform", "unknown")
             session_id = str(session)
-            return f"[{platform}:{session_id}]"
+            info = f"[{platform}:{session_id}]"
         except Exception:
             return "[session-info-error]"
+        _cache_session_info(session, info)
+        return info
 
     @staticmethod
     def log_error(
-        message: str, error: Exception, session: EventSession | None = None, **kwargs
+        message: str,
+        error: Exception,
+        session: EventSession | str | None = None,
+        **kwargs,
     ):
-        """记录错误日志"""
+        """记录错误日志，异常详情由logger的e=参数按需渲染"""
         session_info = BroadcastManager._get_session_info(session)
-        error_type = type(error).__name__
-        stack_trace = traceback.format_exc()
-        error_details = f"\n类型: {error_type}\n信息: {error!s}\n堆栈: {stack_trace}"
-
-        logger.error(
-            f"{session_info} {message}{error_details}", "广播", e=error, **kwargs
-        )
+        logger.error(f"{session_info} {message}", "广播", e=error, **kwargs)
 
     @staticmethod
-    def log_warning(message: str, session: EventSession | None = None, **kwargs):
+    def log_warning(message: str, session: EventSession | str | None = None, **kwargs):
         """记录警告级别日志"""
         session_info = BroadcastManager._get_session_info(session)
         logger.warning(f"{session_info} {message}", "广播", **kwargs)
 
     @staticmethod
-    def log_info(message: str, session: EventSession | None = None, **kwargs):
+    def log_info(message: str, session: EventSession | str | None = None, **kwargs):
         """记录信息级别日志"""
         session_info = BroadcastManager._get_session_info(session)
         logger.info(f"{session_info} {message}", "广播", **kwargs)
 
-    @classmethod
-    def get_last_broadcast_msg_ids(cls) -> dict[str, int]:
+    @staticmethod
+    def get_last_broadcast_msg_ids() -> dict[str, int]:
         """获取最近广播消息ID"""
-        return cls._last_broadcast_msg_ids.copy()
+        return _last_broadcast_msg_ids.copy()
 
-    @classmethod
-    def clear_last_broadcast_msg_ids(cls) -> None:
+    @staticmethod
+    def clear_last_broadcast_msg_ids() -> None:
         """清空消息ID记录"""
-        cls._last_broadcast_msg_ids.clear()
+        _last_broadcast_msg_ids.clear()
 
-    @classmethod
-    async def get_all_groups(cls, bot: Bot) -> tuple[list[GroupConsole], str]:
+    @staticmethod
+    async def get_all_groups(bot: Bot) -> tuple[list[GroupConsole], str]:
         """获取群组列表"""
         return await PlatformUtils.get_group_list(bot)
 
@@ -82,18 +152,44 @@ class BroadcastManager:
     async def send(
         cls, bot: Bot, message: UniMessage, session: EventSession
     ) -> BroadcastResult:
-        """发送广播到所有群组"""
-        logger.debug(
-            f"开始广播(send - 广播到所有群组)，Bot ID: {bot.self_id}",
-            "广播",
-            session=session,
+        """发送广播到所有群组，相同内容的并发广播会合并为一次发送"""
+        key = hashlib.blake2b(
+            str(message).encode() + bot.self_id.encode(), digest_size=16
+        ).hexdigest()
+        if inflight := cls._inflight.get(key):
+            logger.warning(
+                "检测到相同内容的广播正在进行中，等待其结果", "广播", session=session
+            )
+            return await inflight
+
+        future: asyncio.Future[BroadcastResult] = (
+            asyncio.get_running_loop().create_future()
         )
+        cls._inflight[key] = future
+        try:
+            logger.debug(
+                f"开始广播(send - 广播到所有群组)，Bot ID: {bot.self_id}",
+                "广播",
+                session=session,
+            )
 
-        logger.debug("清空上一次的广播消息ID记录", "广播", session=session)
-        cls.clear_last_broadcast_msg_ids()
+            logger.debug("清空上一次的广播消息ID记录", "广播", session=session)
+            cls.clear_last_broadcast_msg_ids()
 
-        all_groups, _ = await cls.get_all_groups(bot)
-        return await cls.send_to_specific_groups(bot, message, all_groups, session)
+            all_groups, _ = await cls.get_all_groups(bot)
+            result = await cls.send_to_specific_groups(
+                bot, message, all_groups, session
+            )
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            # 无重复广播等待该future时主动取出异常，
+            # 避免asyncio的 exception was never retrieved 告警
+            future.exception()
+            raise
+        finally:
+            cls._inflight.pop(key, None)
 
     @classmethod
     async def send_to_specific_groups(
@@ -116,19 +212,17 @@ class BroadcastManager:
             return 0, 0
 
         platform = PlatformUtils.get_platform(bot)
-        is_forward_broadcast = any(
-            isinstance(seg, Reference) and getattr(seg, "nodes", None)
-            for seg in message
-        )
+        ref_seg = None
+        for seg in message:
+            if isinstance(seg, Reference) and getattr(seg, "nodes", None):
+                ref_seg = seg
+                break
+        is_forward_broadcast = ref_seg is not None
 
         if platform == "qq" and isinstance(bot, V11Bot) and is_forward_broadcast:
-            if (
-                len(message) == 1
-                and isinstance(message[0], Reference)
-                and getattr(message[0], "nodes", None)
-            ):
-                nodes_list = getattr(message[0], "nodes", [])
-                v11_nodes = custom_nodes_to_v11_nodes(nodes_list)
+            if len(message) == 1 and message[0] is ref_seg:
+                nodes_list = getattr(ref_seg, "nodes", [])
+                v11_nodes = tuple(custom_nodes_to_v11_nodes(nodes_list))
                 node_count = len(v11_nodes)
                 logger.debug(
                     f"从 UniMessage<Reference> 构造转发节点数: {node_count}",
@@ -143,7 +237,7 @@ class BroadcastManager:
                 )
                 v11_content_list = uni_message_to_v11_list_of_dicts(message)
                 v11_nodes = (
-                    [
+                    (
                         {
                             "type": "node",
                             "data": {
@@ -151,10 +245,10 @@ class BroadcastManager:
                                 "nickname": "广播",
                                 "content": v11_content_list,
                             },
-                        }
-                    ]
+                        },
+                    )
                     if v11_content_list
-                    else []
+                    else ()
                 )
 
             if not v11_nodes:
@@ -179,22 +273,22 @@ class BroadcastManager:
             )
 
         total = len(target_groups)
-        stats = f"成功: {success_count}, 失败: {error_count}"
-        stats += f", 跳过: {skip_count}, 总计: {total}"
         logger.debug(
-            f"广播统计 - {stats}",
+            f"广播统计 - 成功: {success_count}, 失败: {error_count}, "
+            f"跳过: {skip_count}, 总计: {total}",
             "广播",
             session=log_session,
         )
 
-        msg_ids = cls.get_last_broadcast_msg_ids()
+        msg_ids = _last_broadcast_msg_ids
         if msg_ids:
-            id_list_str = ", ".join([f"{k}:{v}" for k, v in msg_ids.items()])
-            logger.debug(
-                f"广播结束，记录了 {len(msg_ids)} 条消息ID: {id_list_str}",
-                "广播",
-                session=log_session,
-            )
+            if _DEBUG_ENABLED:
+                id_list_str = ", ".join(f"{k}:{v}" for k, v in msg_ids.items())
+                logger.debug(
+                    f"广播结束，记录了 {len(msg_ids)} 条消息ID: {id_list_str}",
+                    "广播",
+                    session=log_session,
+                )
         else:
             logger.warning(
                 "广播结束，但没有记录任何消息ID",
@@ -204,98 +298,109 @@ class BroadcastManager:
 
         return success_count, error_count
 
-    @classmethod
-    async def _extract_message_id_from_result(
-        cls,
+    @staticmethod
+    def _extract_message_id_from_result(
         result: dict | Receipt,
         group_key: str,
         session_info: EventSession | str,
         msg_type: str = "普通",
     ) -> None:
         """提取消息ID并记录"""
-        if isinstance(result, dict) and "message_id" in result:
-            msg_id = result["message_id"]
-            try:
-                msg_id_int = int(msg_id)
-                cls._last_broadcast_msg_ids[group_key] = msg_id_int
-                logger.debug(
-                    f"记录群 {group_key} 的{msg_type}消息ID: {msg_id_int}",
-                    "广播",
-                    session=session_info,
-                )
-            except (ValueError, TypeError):
-                logger.warning(
-                    f"{msg_type}结果中的 message_id 不是有效整数: {msg_id}",
-                    "广播",
-                    session=session_info,
-                )
+        if type(result) is dict:
+            mid = result.get("message_id")
         elif isinstance(result, Receipt) and result.msg_ids:
-            try:
-                first_id_info = result.msg_ids[0]
-                msg_id = None
-                if isinstance(first_id_info, dict) and "message_id" in first_id_info:
-                    msg_id = first_id_info["message_id"]
-                    logger.debug(
-                        f"从 Receipt.msg_ids[0] 提取到 ID: {msg_id}",
-                        "广播",
-                        session=session_info,
-                    )
-                elif isinstance(first_id_info, int | str):
-                    msg_id = first_id_info
-                    logger.debug(
-                        f"从 Receipt.msg_ids[0] 提取到原始ID: {msg_id}",
-                        "广播",
-                        session=session_info,
-                    )
-
-                if msg_id is not None:
-                    try:
-                        msg_id_int = int(msg_id)
-                        cls._last_broadcast_msg_ids[group_key] = msg_id_int
-                        logger.debug(
-                            f"记录群 {group_key} 的消息ID: {msg_id_int}",
-                            "广播",
-                            session=session_info,
-                        )
-                    except (ValueError, TypeError):
-                        logger.warning(
-                            f"提取的ID ({msg_id}) 不是有效整数",
-                            "广播",
-                            session=session_info,
-                        )
-                else:
-                    info_str = str(first_id_info)
-                    logger.warning(
-                        f"无法从 Receipt.msg_ids[0] 提取ID: {info_str}",
-                        "广播",
-                        session=session_info,
-                    )
-            except IndexError:
-                logger.warning("Receipt.msg_ids 为空", "广播", session=session_info)
-            except Exception as e_extract:
-                logger.error(
-                    f"从 Receipt 提取 msg_id 时出错: {e_extract}",
-                    "广播",
-                    session=session_info,
-                    e=e_extract,
-                )
+            first = result.msg_ids[0]
+            mid = first.get("message_id") if type(first) is dict else first
         else:
+            mid = None
+
+        if mid is None:
             logger.warning(
                 f"发送成功但无法从结果获取消息 ID. 结果: {result}",
                 "广播",
                 session=session_info,
             )
+            return
+
+        try:
+            msg_id_int = int(mid)
+        except (TypeError, ValueError):
+            logger.warning(
+                f"{msg_type}结果中提取的消息ID不是有效整数: {mid}",
+                "广播",
+                session=session_info,
+            )
+            return
+
+        _last_broadcast_msg_ids[group_key] = msg_id_int
+        if _DEBUG_ENABLED:
+            logger.debug(
+                f"记录群 {group_key} 的{msg_type}消息ID: {msg_id_int}",
+                "广播",
+                session=session_info,
+            )
+
+    @staticmethod
+    async def _filter_available(
+        bot: Bot, group_list: list[GroupConsole]
+    ) -> tuple[list[GroupConsole], int]:
+        """一次性批量检查群组可用性
+
+        返回:
+            tuple[list[GroupConsole], int]: (可用群组, 跳过数量)
+        """
+        candidates = [group for group in group_list if group.group_id]
+        skip_count = len(group_list) - len(candidates)
+        if not candidates:
+            return [], skip_count
+        blocked_list = await asyncio.gather(
+            *(
+                CommonUtils.task_is_block(bot, "broadcast", group.group_id)
+                for group in candidates
+            )
+        )
+        available = [
+            group for group, blocked in zip(candidates, blocked_list) if not blocked
+        ]
+        skip_count += len(candidates) - len(available)
+        return available, skip_count
 
     @classmethod
-    async def _check_group_availability(cls, bot: Bot, group: GroupConsole) -> bool:
-        """检查群组是否可用"""
-        if not group.group_id:
-            return False
+    async def _send_forward_to_group(
+        cls,
+        bot: V11Bot,
+        group: GroupConsole,
+        v11_nodes: tuple[dict, ...],
+        session_info: EventSession | str,
+    ) -> tuple[str, str | None, dict | None]:
+        """向单个群组发送合并转发消息
 
-        if await CommonUtils.task_is_block(bot, "broadcast", group.group_id):
-            return False
+        返回:
+            tuple: (状态 ok/err/skip, 群组key, 发送结果)
+        """
+        group_key = group.group_id or group.channel_id
 
-        return True
+        try:
+            await cls._acquire_send_token()
+            result = await bot.send_group_forward_msg(
+                group_id=int(group.group_id), messages=list(v11_nodes)
+            )
+
+            logger.debug(
+                f"合并转发消息发送结果: {result}, 类型: {type(result)}",
+                "广播",
+                session=session_info,
+            )
+
+            return "ok", group_key, result
+        except Exception as e:
+            logger.error(
+                f"发送失败(合并转发) to {group_key}: {e}",
+                "广播",
+                session=session_info,
+                e=e,
+            )
+            return "err", group_key, None
 
     @classmethod
     async def _broadcast_forward(
@@ -303,55 +408,78 @@ class BroadcastManager:
         bot: V11Bot,
         session_info: EventSession | str,
         group_list: list[GroupConsole],
-        v11_nodes: list[dict],
+        v11_nodes: tuple[dict, ...],
     ) -> BroadcastDetailResult:
-        """发送合并转发"""
+        """发送合并转发，按批并发发送，发送速率由令牌桶统一控制
+
+        转发节点在广播前构造并冻结一次，所有群组共享同一份载荷，
+        避免每个群组重复构造与编码大体积节点内容
+        """
         success_count = 0
         error_count = 0
-        skip_count = 0
 
-        for _, group in enumerate(group_list):
-            group_key = group.group_id or group.channel_id
+        group_list, skip_count = await cls._filter_available(bot, group_list)
 
-            if not await cls._check_group_availability(bot, group):
-                skip_count += 1
-                continue
-
-            try:
-                result = await bot.send_group_forward_msg(
-                    group_id=int(group.group_id), messages=v11_nodes
-                )
+        for start in range(0, len(group_list), cls.CHUNK_SIZE):
+            chunk = group_list[start : start + cls.CHUNK_SIZE]
+            results = await asyncio.gather(
+                *(
+                    cls._send_forward_to_group(bot, group, v11_nodes, session_info)
+                    for group in chunk
+                ),
+                return_exceptions=True,
+            )
+            async with cls._msg_ids_lock:
+                for result in results:
+                    if isinstance(result, BaseException):
+                        error_count += 1
+                        continue
+                    status, group_key, payload = result
+                    if status == "ok":
+                        success_count += 1
+                        cls._extract_message_id_from_result(
+                            payload, group_key, session_info, "合并转发"
+                        )
+                    elif status == "err":
+                        error_count += 1
+                    else:
+                        skip_count += 1
+        return success_count, error_count, skip_count
 
-                logger.debug(
-                    f"合并转发消息发送结果: {result}, 类型: {type(result)}",
-                    "广播",
-                    session=session_info,
-                )
+    @classmethod
+    async def _send_normal_to_group(
+        cls,
+        bot: Bot,
+        group: GroupConsole,
+        group_key: str,
+        target,
+        message: UniMessage,
+        session_info: EventSession | str,
+    ) -> tuple[str, str, Receipt | None]:
+        """向单个群组发送普通消息
 
-                await cls._extract_message_id_from_result(
-                    result, group_key, session_info, "合并转发"
-                )
+        返回:
+            tuple: (状态 ok/err/skip, 群组key, Receipt)
+        """
+        try:
+            await cls._acquire_send_token()
+            receipt: Receipt = await message.send(target, bot=bot)
 
-                success_count += 1
-                await asyncio.sleep(random.randint(1, 3))
-            except ActionFailed as af_e:
-                error_count += 1
-                logger.error(
-                    f"发送失败(合并转发) to {group_key}: {af_e}",
-                    "广播",
-                    session=session_info,
-                    e=af_e,
-                )
-            except Exception as e:
-                error_count += 1
-                logger.error(
-                    f"发送失败(合并转发) to {group_key}: {e}",
-                    "广播",
-                    session=session_info,
-                    e=e,
-                )
+            logger.debug(
+                f"广播消息发送结果: {receipt}, 类型: {type(receipt)}",
+                "广播",
+                session=session_info,
+            )
 
-        return success_count, error_count, skip_count
+            return "ok", group_key, receipt
+        except Exception as e:
+            logger.error(
+                f"发送失败(普通) to {group_key}: {e}",
+                "广播",
+                session=session_info,
+                e=e,
+            )
+            return "err", group_key, None
 
     @classmethod
     async def _broadcast_normal(
@@ -364,52 +492,49 @@ class BroadcastManager:
         """发送普通消息"""
         success_count = 0
         error_count = 0
-        skip_count = 0
 
-        for _, group in enumerate(group_list):
+        group_list, skip_count = await cls._filter_available(bot, group_list)
+
+        prepared: list[tuple[GroupConsole, str, object]] = []
+        for group in group_list:
             group_key = (
                 f"{group.group_id}:{group.channel_id}"
                 if group.channel_id
                 else str(group.group_id)
             )
-
-            if not await cls._check_group_availability(bot, group):
+            target = PlatformUtils.get_target(
+                group_id=group.group_id, channel_id=group.channel_id
+            )
+            if not target:
+                logger.warning(
+                    "target为空", "广播", session=session_info, target=group_key
+                )
                 skip_count += 1
                 continue
+            prepared.append((group, group_key, target))
 
-            try:
-                target = PlatformUtils.get_target(
-                    group_id=group.group_id, channel_id=group.channel_id
-                )
-
-                if target:
-                    receipt: Receipt = await message.send(target, bot=bot)
+        sem = asyncio.Semaphore(cls.CONCURRENCY)
 
-                    logger.debug(
-                        f"广播消息发送结果: {receipt}, 类型: {type(receipt)}",
-                        "广播",
-                        session=session_info,
-                    )
+        async def _send(group: GroupConsole, group_key: str, target):
+            async with sem:
+                return await cls._send_normal_to_group(
+                    bot, group, group_key, target, message, session_info
+                )
 
-                    await cls._extract_message_id_from_result(
+        results = await asyncio.gather(
+            *(_send(group, group_key, target) for group, group_key, target in prepared)
+        )
+        async with cls._msg_ids_lock:
+            for status, group_key, receipt in results:
+                if status == "ok":
+                    success_count += 1
+                    cls._extract_message_id_from_result(
                         receipt, group_key, session_info
                     )
-
-                    success_count += 1
-                    await asyncio.sleep(random.randint(1, 3))
+                elif status == "err":
+                    error_count += 1
                 else:
-                    logger.warning(
-                        "target为空", "广播", session=session_info, target=group_key
-                    )
                     skip_count += 1
-            except Exception as e:
-                error_count += 1
-                logger.error(
-                    f"发送失败(普通) to {group_key}: {e}",
-                    "广播",
-                    session=session_info,
-                    e=e,
-                )
 
         return success_count, error_count, skip_count
 
@@ -426,15 +551,15 @@ class BroadcastManager:
             )
             return 0, 0
 
-        id_list_str = ", ".join([f"{k}:{v}" for k, v in msg_ids_to_recall.items()])
-        logger.debug(
-            f"找到 {len(msg_ids_to_recall)} 条广播消息ID记录: {id_list_str}",
-            "广播撤回",
-            session=session_info,
-        )
-
-        success_count = 0
-        error_count = 0
+        if _DEBUG_ENABLED:
+            id_list_str = ", ".join(
+                f"{k}:{v}" for k, v in msg_ids_to_recall.items()
+            )
+            logger.debug(
+                f"找到 {len(msg_ids_to_recall)} 条广播消息ID记录: {id_list_str}",
+                "广播撤回",
+                session=session_info,
+            )
 
         logger.info(
             f"准备撤回 {len(msg_ids_to_recall)} 条广播消息",
@@ -442,47 +567,61 @@ class BroadcastManager:
             session=session_info,
         )
 
-        for group_key, msg_id in msg_ids_to_recall.items():
-            try:
-                logger.debug(
-                    f"尝试撤回消息 (ID: {msg_id}) in {group_key}",
-                    "广播撤回",
-                    session=session_info,
-                )
-                await bot.call_api("delete_msg", message_id=msg_id)
-                success_count += 1
-            except ActionFailed as af_e:
-                retcode = getattr(af_e, "retcode", None)
-                wording = getattr(af_e, "wording", "")
-                if retcode == 100 and "MESSAGE_NOT_FOUND" in wording.upper():
-                    logger.warning(
-                        f"消息 (ID: {msg_id}) 可能已被撤回或不存在于 {group_key}",
+        sem = asyncio.Semaphore(10)
+
+        async def _recall_one(group_key: str, msg_id: int) -> str:
+            """撤回单条消息，返回 ok/warn/err 状态"""
+            async with sem:
+                try:
+                    logger.debug(
+                        f"尝试撤回消息 (ID: {msg_id}) in {group_key}",
                         "广播撤回",
                         session=session_info,
                     )
-                elif retcode == 300 and "delete message" in wording.lower():
-                    logger.warning(
-                        f"消息 (ID: {msg_id}) 可能已被撤回或不存在于 {group_key}",
+                    await bot.call_api("delete_msg", message_id=msg_id)
+                    await asyncio.sleep(0.2)
+                    return "ok"
+                except ActionFailed as af_e:
+                    retcode = getattr(af_e, "retcode", None)
+                    wording = getattr(af_e, "wording", "")
+                    if retcode == 100 and "MESSAGE_NOT_FOUND" in wording.upper():
+                        logger.warning(
+                            f"消息 (ID: {msg_id}) 可能已被撤回或不存在于 {group_key}",
+                            "广播撤回",
+                            session=session_info,
+                        )
+                        return "warn"
+                    if retcode == 300 and "delete message" in wording.lower():
+                        logger.warning(
+                            f"消息 (ID: {msg_id}) 可能已被撤回或不存在于 {group_key}",
+                            "广播撤回",
+                            session=session_info,
+                        )
+                        return "warn"
+                    logger.error(
+                        f"撤回消息失败 (ID: {msg_id}) in {group_key}: {af_e}",
                         "广播撤回",
                         session=session_info,
+                        e=af_e,
                     )
-                else:
-                    error_count += 1
+                    return "err"
+                except Exception as e:
                     logger.error(
-                        f"撤回消息失败 (ID: {msg_id}) in {group_key}: {af_e}",
+                        f"撤回消息时发生未知错误 (ID: {msg_id}) in {group_key}: {e}",
                         "广播撤回",
                         session=session_info,
-                        e=af_e,
+                        e=e,
                     )
-            except Exception as e:
-                error_count += 1
-                logger.error(
-                    f"撤回消息时发生未知错误 (ID: {msg_id}) in {group_key}: {e}",
-                    "广播撤回",
-                    session=session_info,
-                    e=e,
-                )
-            await asyncio.sleep(0.2)
+                    return "err"
+
+        results = await asyncio.gather(
+            *(
+                _recall_one(group_key, msg_id)
+                for group_key, msg_id in msg_ids_to_recall.items()
+            )
+        )
+        success_count = results.count("ok")
+        error_count = results.count("err")
 
         logger.debug("撤回操作完成，清空消息ID记录", "广播撤回", session=session_info)
         cls.clear_last_broadcast_msg_ids()
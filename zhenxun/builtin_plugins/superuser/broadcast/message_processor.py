@@ -1,5 +1,6 @@
-import base64
-import json
+import asyncio
+from collections.abc import Callable
+from functools import lru_cache
 from typing import Any
 
 from nonebot.adapters import Bot, Event
@@ -20,6 +21,7 @@ from nonebot_plugin_alconna.uniseg.segment import (
 )
 from nonebot_plugin_alconna.uniseg.tools import reply_fetch
 from nonebot_plugin_session import EventSession
+import ujson as json
 
 from zhenxun.services.log import logger
 from zhenxun.utils.common_utils import CommonUtils
@@ -29,9 +31,66 @@ from .broadcast_manager import BroadcastManager
 
 MAX_FORWARD_DEPTH = 3
 
+_forward_fetch_semaphore = asyncio.Semaphore(16)
+"""并发get_forward_msg请求上限，防止超大转发树一次性展开打满连接"""
+
+
+@lru_cache(maxsize=256)
+def _extract_resid(json_data_str: str) -> str | None:
+    """从转发卡片JSON中提取resid，相同卡片载荷只解析一次"""
+    try:
+        json_data = json.loads(json_data_str)
+    except Exception:
+        return None
+    if (
+        json_data.get("app") == "com.tencent.multimsg"
+        or json_data.get("view") == "Forward"
+    ):
+        return json_data.get("meta", {}).get("detail", {}).get("resid") or None
+    return None
+
+
+async def _bounded_get_forward(bot: Bot, forward_id: str) -> Any:
+    async with _forward_fetch_semaphore:
+        return await bot.call_api("get_forward_msg", id=forward_id)
+
+
+def _normalize_forward_data(forward_data: Any) -> list | None:
+    """归一化get_forward_msg的三种响应结构为节点列表"""
+    if isinstance(forward_data, dict):
+        if "messages" in forward_data:
+            return forward_data["messages"]
+        data = forward_data.get("data")
+        if isinstance(data, dict) and "message" in data:
+            return data["message"]
+        return None
+    if isinstance(forward_data, list):
+        return forward_data
+    return None
+
+
+async def _fetch_forward(
+    bot: Bot, forward_id: str, cache: dict[str, "asyncio.Task"] | None = None
+) -> list | None:
+    """获取合并转发节点列表，同一次广播内相同ID只请求一次API
+
+    缓存中存放请求Task，并发解析同一ID的兄弟节点会等待首个请求而非重复发起
+    """
+    if cache is None:
+        return _normalize_forward_data(await _bounded_get_forward(bot, forward_id))
+    task = cache.get(forward_id)
+    if task is None:
+        task = asyncio.create_task(_bounded_get_forward(bot, forward_id))
+        cache[forward_id] = task
+    return _normalize_forward_data(await task)
+
 
 async def _process_forward_content(
-    forward_content: Any, forward_id: str | None, bot: Bot, depth: int
+    forward_content: Any,
+    forward_id: str | None,
+    bot: Bot,
+    depth: int,
+    cache: dict[str, "asyncio.Task"] | None = None,
 ) -> list[CustomNode]:
     """处理转发消息内容"""
     nodes_for_alc = []
@@ -58,10 +117,13 @@ async def _process_forward_content(
                 "广播",
             )
             content_parsed = True
-            for node_data in nodes_from_content:
-                node = await _create_custom_node_from_data(node_data, bot, depth + 1)
-                if node:
-                    nodes_for_alc.append(node)
+            created = await asyncio.gather(
+                *(
+                    _create_custom_node_from_data(node_data, bot, depth + 1, cache)
+                    for node_data in nodes_from_content
+                )
+            )
+            nodes_for_alc.extend(node for node in created if node)
 
     if not content_parsed and forward_id:
         logger.debug(
@@ -69,20 +131,7 @@ async def _process_forward_content(
             "广播",
         )
         try:
-            forward_data = await bot.call_api("get_forward_msg", id=forward_id)
-            nodes_list = None
-
-            if isinstance(forward_data, dict) and "messages" in forward_data:
-                nodes_list = forward_data["messages"]
-            elif (
-                isinstance(forward_data, dict)
-                and "data" in forward_data
-                and isinstance(forward_data["data"], dict)
-                and "message" in forward_data["data"]
-            ):
-                nodes_list = forward_data["data"]["message"]
-            elif isinstance(forward_data, list):
-                nodes_list = forward_data
+            nodes_list = await _fetch_forward(bot, forward_id, cache)
 
             if nodes_list:
                 node_count = len(nodes_list)
@@ -90,12 +139,13 @@ async def _process_forward_content(
                     f"[D{depth + 1}] 节点:{node_count}",
                     "广播",
                 )
-                for node_data in nodes_list:
-                    node = await _create_custom_node_from_data(
-                        node_data, bot, depth + 1
+                created = await asyncio.gather(
+                    *(
+                        _create_custom_node_from_data(node_data, bot, depth + 1, cache)
+                        for node_data in nodes_list
                     )
-                    if node:
-                        nodes_for_alc.append(node)
+                )
+                nodes_for_alc.extend(node for node in created if node)
             else:
                 logger.warning(
                     f"[D{depth + 1}] ID:{forward_id}无节点",
@@ -163,7 +213,10 @@ async def _process_forward_content(
 
 
 async def _create_custom_node_from_data(
-    node_data: dict, bot: Bot, depth: int
+    node_data: dict,
+    bot: Bot,
+    depth: int,
+    cache: dict[str, "asyncio.Task"] | None = None,
 ) -> CustomNode | None:
     """从节点数据创建CustomNode"""
     node_content_raw = node_data.get("message") or node_data.get("content")
@@ -176,7 +229,7 @@ async def _create_custom_node_from_data(
     name = sender.get("nickname", f"用户{uid[:4]}")
 
     extracted_uni_msg = await _extract_content_from_message(
-        node_content_raw, bot, depth
+        node_content_raw, bot, depth, cache
     )
     if not extracted_uni_msg:
         return None
@@ -217,21 +270,10 @@ async def _extract_broadcast_content(
         logger.debug("检测到命令参数内容，优先使用参数内容", "广播", session=session)
         broadcast_content_msg = UniMessage(processed_command_list)
 
-        if not broadcast_content_msg.filter(
-            lambda x: not (isinstance(x, Text) and not x.text.strip())
-        ):
-            logger.warning(
-                "命令参数内容解析后为空或只包含空白", "广播", session=session
-            )
-            broadcast_content_msg = None
-
     if not broadcast_content_msg:
+        forward_cache: dict[str, asyncio.Task] = {}
         reply_segment_obj: Reply | None = await reply_fetch(event, bot)
-        if (
-            reply_segment_obj
-            and hasattr(reply_segment_obj, "msg")
-            and reply_segment_obj.msg
-        ):
+        if reply_segment_obj is not None and reply_segment_obj.msg:
             logger.debug(
                 "未检测到有效命令参数，检测到引用消息", "广播", session=session
             )
@@ -247,25 +289,13 @@ async def _extract_broadcast_content(
                             is_forward = bool(forward_id)
                             break
                         elif seg.type == "json":
-                            try:
-                                json_data_str = seg.data.get("data", "{}")
-                                if isinstance(json_data_str, str):
-                                    import json
-
-                                    json_data = json.loads(json_data_str)
-                                    if (
-                                        json_data.get("app") == "com.tencent.multimsg"
-                                        or json_data.get("view") == "Forward"
-                                    ) and json_data.get("meta", {}).get(
-                                        "detail", {}
-                                    ).get("resid"):
-                                        forward_id = json_data["meta"]["detail"][
-                                            "resid"
-                                        ]
-                                        is_forward = True
-                                        break
-                            except Exception:
-                                pass
+                            json_data_str = seg.data.get("data", "{}")
+                            if isinstance(json_data_str, str) and (
+                                resid := _extract_resid(json_data_str)
+                            ):
+                                forward_id = resid
+                                is_forward = True
+                                break
 
             if is_forward and forward_id:
                 logger.info(
@@ -275,21 +305,11 @@ async def _extract_broadcast_content(
                 )
                 nodes_to_forward: list[CustomNode] = []
                 try:
-                    forward_data = await bot.call_api("get_forward_msg", id=forward_id)
-                    nodes_list = None
-                    if isinstance(forward_data, dict) and "messages" in forward_data:
-                        nodes_list = forward_data["messages"]
-                    elif (
-                        isinstance(forward_data, dict)
-                        and "data" in forward_data
-                        and isinstance(forward_data["data"], dict)
-                        and "message" in forward_data["data"]
-                    ):
-                        nodes_list = forward_data["data"]["message"]
-                    elif isinstance(forward_data, list):
-                        nodes_list = forward_data
+                    nodes_list = await _fetch_forward(bot, forward_id, forward_cache)
 
                     if nodes_list is not None:
+                        node_infos = []
+                        extract_coros = []
                         for node_data in nodes_list:
                             node_sender = node_data.get("sender", {})
                             node_user_id = str(node_sender.get("user_id", "10000"))
@@ -300,19 +320,28 @@ async def _extract_broadcast_content(
                                 "message"
                             ) or node_data.get("content")
                             if node_content_raw:
-                                extracted_node_uni_msg = (
-                                    await _extract_content_from_message(
-                                        node_content_raw, bot
+                                node_infos.append((node_user_id, node_nickname))
+                                extract_coros.append(
+                                    _extract_content_from_message(
+                                        node_content_raw, bot, cache=forward_cache
                                     )
                                 )
-                                if extracted_node_uni_msg:
-                                    nodes_to_forward.append(
-                                        CustomNode(
-                                            uid=node_user_id,
-                                            name=node_nickname,
-                                            content=extracted_node_uni_msg,
-                                        )
+                        extracted_list = (
+                            await asyncio.gather(*extract_coros)
+                            if extract_coros
+                            else []
+                        )
+                        for (node_user_id, node_nickname), node_uni_msg in zip(
+                            node_infos, extracted_list
+                        ):
+                            if node_uni_msg:
+                                nodes_to_forward.append(
+                                    CustomNode(
+                                        uid=node_user_id,
+                                        name=node_nickname,
+                                        content=node_uni_msg,
                                     )
+                                )
                     if nodes_to_forward:
                         broadcast_content_msg = UniMessage(
                             Reference(nodes=nodes_to_forward)
@@ -330,7 +359,7 @@ async def _extract_broadcast_content(
                     return None
             else:
                 broadcast_content_msg = await _extract_content_from_message(
-                    raw_quoted_content, bot
+                    raw_quoted_content, bot, cache=forward_cache
                 )
         else:
             logger.debug("未检测到命令参数和引用消息", "广播", session=session)
@@ -351,14 +380,65 @@ async def _extract_broadcast_content(
     return broadcast_content_msg
 
 
+def _handle_v11_text(data_dict: dict, depth: int, index: int) -> list[alc.Segment]:
+    text_content = data_dict.get("text", "")
+    if isinstance(text_content, str) and text_content.strip():
+        return [Text(text_content)]
+    return []
+
+
+def _handle_v11_image(data_dict: dict, depth: int, index: int) -> list[alc.Segment]:
+    if data_dict.get("url"):
+        return [Image(url=data_dict["url"])]
+    if file_val := data_dict.get("file"):
+        if isinstance(file_val, str) and file_val.startswith("base64://"):
+            return [Image(url=file_val)]
+        return [Image(path=file_val)]
+    logger.warning(f"[Depth {depth}] V11 图片 {index} 缺少URL/文件", "广播")
+    return []
+
+
+def _handle_v11_at(data_dict: dict, depth: int, index: int) -> list[alc.Segment]:
+    target_qq = data_dict.get("qq", "")
+    if target_qq.lower() == "all":
+        return [AtAll()]
+    if target_qq:
+        return [At(flag="user", target=target_qq)]
+    return []
+
+
+def _handle_v11_video(data_dict: dict, depth: int, index: int) -> list[alc.Segment]:
+    if data_dict.get("url"):
+        video_seg = Video(url=data_dict["url"])
+    elif file_val := data_dict.get("file"):
+        if isinstance(file_val, str) and file_val.startswith("base64://"):
+            video_seg = Video(url=file_val)
+        else:
+            video_seg = Video(path=file_val)
+    else:
+        logger.warning(f"[Depth {depth}] V11 视频 {index} 缺少URL/文件", "广播")
+        return []
+    logger.debug(f"[Depth {depth}] 处理视频消息成功", "广播")
+    return [video_seg]
+
+
+_V11_SEG_HANDLERS: dict[str, Callable[[dict, int, int], list[alc.Segment]]] = {
+    "text": _handle_v11_text,
+    "image": _handle_v11_image,
+    "at": _handle_v11_at,
+    "video": _handle_v11_video,
+}
+"""V11消息段分发表，常见类型一次哈希命中处理函数"""
+
+
 async def _process_v11_segment(
-    seg_obj: V11MessageSegment | dict, depth: int, index: int, bot: Bot
+    seg_obj: V11MessageSegment | dict,
+    depth: int,
+    index: int,
+    bot: Bot,
+    cache: dict[str, "asyncio.Task"] | None = None,
 ) -> list[alc.Segment]:
     """处理V11消息段"""
-    result = []
-    seg_type = None
-    data_dict = None
-
     if isinstance(seg_obj, V11MessageSegment):
         seg_type = seg_obj.type
         data_dict = seg_obj.data
@@ -366,79 +446,41 @@ async def _process_v11_segment(
         seg_type = seg_obj.get("type")
         data_dict = seg_obj.get("data")
     else:
-        return result
+        return []
 
     if not (seg_type and data_dict is not None):
         logger.warning(f"[D{depth}] 跳过无效数据: {type(seg_obj)}", "广播")
-        return result
-
-    if seg_type == "text":
-        text_content = data_dict.get("text", "")
-        if isinstance(text_content, str) and text_content.strip():
-            result.append(Text(text_content))
-    elif seg_type == "image":
-        img_seg = None
-        if data_dict.get("url"):
-            img_seg = Image(url=data_dict["url"])
-        elif data_dict.get("file"):
-            file_val = data_dict["file"]
-            if isinstance(file_val, str) and file_val.startswith("base64://"):
-                b64_data = file_val[9:]
-                raw_bytes = base64.b64decode(b64_data)
-                img_seg = Image(raw=raw_bytes)
-            else:
-                img_seg = Image(path=file_val)
-        if img_seg:
-            result.append(img_seg)
-        else:
-            logger.warning(f"[Depth {depth}] V11 图片 {index} 缺少URL/文件", "广播")
-    elif seg_type == "at":
-        target_qq = data_dict.get("qq", "")
-        if target_qq.lower() == "all":
-            result.append(AtAll())
-        elif target_qq:
-            result.append(At(flag="user", target=target_qq))
-    elif seg_type == "video":
-        video_seg = None
-        if data_dict.get("url"):
-            video_seg = Video(url=data_dict["url"])
-        elif data_dict.get("file"):
-            file_val = data_dict["file"]
-            if isinstance(file_val, str) and file_val.startswith("base64://"):
-                b64_data = file_val[9:]
-                raw_bytes = base64.b64decode(b64_data)
-                video_seg = Video(raw=raw_bytes)
-            else:
-                video_seg = Video(path=file_val)
-        if video_seg:
-            result.append(video_seg)
-            logger.debug(f"[Depth {depth}] 处理视频消息成功", "广播")
-        else:
-            logger.warning(f"[Depth {depth}] V11 视频 {index} 缺少URL/文件", "广播")
-    elif seg_type == "forward":
+        return []
+
+    if handler := _V11_SEG_HANDLERS.get(seg_type):
+        return handler(data_dict, depth, index)
+
+    if seg_type == "forward":
         nested_forward_id = data_dict.get("id") or data_dict.get("resid")
         nested_forward_content = data_dict.get("content")
 
         logger.debug(f"[D{depth}] 嵌套转发ID: {nested_forward_id}", "广播")
 
         nested_nodes = await _process_forward_content(
-            nested_forward_content, nested_forward_id, bot, depth
+            nested_forward_content, nested_forward_id, bot, depth, cache
         )
 
         if nested_nodes:
-            result.append(Reference(nodes=nested_nodes))
-    else:
-        logger.warning(f"[D{depth}] 跳过类型: {seg_type}", "广播")
+            return [Reference(nodes=nested_nodes)]
+        return []
 
-    return result
+    logger.warning(f"[D{depth}] 跳过类型: {seg_type}", "广播")
+    return []
 
 
 async def _extract_content_from_message(
-    message_content: Any, bot: Bot, depth: int = 0
+    message_content: Any,
+    bot: Bot,
+    depth: int = 0,
+    cache: dict[str, "asyncio.Task"] | None = None,
 ) -> UniMessage:
     """提取消息内容到UniMessage"""
     temp_msg = UniMessage()
-    input_type_str = str(type(message_content))
 
     if depth >= MAX_FORWARD_DEPTH:
         logger.warning(
@@ -448,6 +490,27 @@ async def _extract_content_from_message(
         temp_msg.append(Text("[嵌套转发层数过多，内容已省略]"))
         return temp_msg
 
+    if depth == 0 and isinstance(message_content, UniMessage) and message_content:
+        simple = True
+        for seg_obj in message_content:
+            if isinstance(seg_obj, Text):
+                if not seg_obj.text.strip():
+                    simple = False
+                    break
+            elif isinstance(seg_obj, Image | Video):
+                if not (
+                    getattr(seg_obj, "url", None)
+                    or getattr(seg_obj, "path", None)
+                    or getattr(seg_obj, "raw", None)
+                ):
+                    simple = False
+                    break
+            elif not isinstance(seg_obj, At | AtAll):
+                simple = False
+                break
+        if simple:
+            return message_content
+
     segments_to_process = []
 
     if isinstance(message_content, UniMessage):
@@ -467,49 +530,66 @@ async def _extract_content_from_message(
             temp_msg.append(Text(message_content))
         return temp_msg
     else:
-        logger.warning(f"[Depth {depth}] 无法处理的输入类型: {input_type_str}", "广播")
+        logger.warning(
+            f"[Depth {depth}] 无法处理的输入类型: {type(message_content).__name__}",
+            "广播",
+        )
         return temp_msg
 
     if segments_to_process:
+        parts: list[list[alc.Segment]] = [[] for _ in segments_to_process]
+        pending: list[tuple[int, Any]] = []
         for index, seg_obj in enumerate(segments_to_process):
             try:
                 if isinstance(seg_obj, Text):
                     text_content = getattr(seg_obj, "text", None)
                     if isinstance(text_content, str) and text_content.strip():
-                        temp_msg.append(seg_obj)
+                        parts[index].append(seg_obj)
                 elif isinstance(seg_obj, Image):
-                    if (
-                        getattr(seg_obj, "url", None)
-                        or getattr(seg_obj, "path", None)
-                        or getattr(seg_obj, "raw", None)
-                    ):
-                        temp_msg.append(seg_obj)
+                    src = seg_obj.url or seg_obj.path or seg_obj.raw
+                    if src:
+                        parts[index].append(seg_obj)
                 elif isinstance(seg_obj, At):
-                    temp_msg.append(seg_obj)
+                    parts[index].append(seg_obj)
                 elif isinstance(seg_obj, AtAll):
-                    temp_msg.append(seg_obj)
+                    parts[index].append(seg_obj)
                 elif isinstance(seg_obj, Video):
-                    if (
-                        getattr(seg_obj, "url", None)
-                        or getattr(seg_obj, "path", None)
-                        or getattr(seg_obj, "raw", None)
-                    ):
-                        temp_msg.append(seg_obj)
+                    src = seg_obj.url or seg_obj.path or seg_obj.raw
+                    if src:
+                        parts[index].append(seg_obj)
                         logger.debug(f"[D{depth}] 处理Video对象成功", "广播")
                 else:
-                    processed_segments = await _process_v11_segment(
-                        seg_obj, depth, index, bot
+                    pending.append(
+                        (index, _process_v11_segment(seg_obj, depth, index, bot, cache))
                     )
-                    temp_msg.extend(processed_segments)
             except Exception as e_conv_seg:
                 logger.warning(
                     f"[D{depth}] 处理段 {index} 出错: {e_conv_seg}",
                     "广播",
                     e=e_conv_seg,
                 )
+        if pending:
+            results = await asyncio.gather(
+                *(coro for _, coro in pending), return_exceptions=True
+            )
+            for (index, _), seg_result in zip(pending, results):
+                if isinstance(seg_result, Exception):
+                    logger.warning(
+                        f"[D{depth}] 处理段 {index} 出错: {seg_result}",
+                        "广播",
+                        e=seg_result,
+                    )
+                elif isinstance(seg_result, BaseException):
+                    raise seg_result
+                else:
+                    parts[index] = seg_result
+        for part in parts:
+            temp_msg.extend(part)
 
     if not temp_msg and message_content:
-        logger.warning(f"未能从类型 {input_type_str} 中提取内容", "广播")
+        logger.warning(
+            f"未能从类型 {type(message_content).__name__} 中提取内容", "广播"
+        )
 
     return temp_msg
 
@@ -542,10 +622,15 @@ async def get_broadcast_target_groups(
         )
         return [], []
 
-    enabled_groups = []
-    for group in target_groups:
-        if not await CommonUtils.task_is_block(bot, "broadcast", group.group_id):
-            enabled_groups.append(group)
+    blocked_list = await asyncio.gather(
+        *(
+            CommonUtils.task_is_block(bot, "broadcast", group.group_id)
+            for group in target_groups
+        )
+    )
+    enabled_groups = [
+        group for group, blocked in zip(target_groups, blocked_list) if not blocked
+    ]
 
     if not enabled_groups:
         await MessageUtils.build_message(
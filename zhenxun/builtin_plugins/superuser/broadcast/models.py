@@ -1,3 +1,4 @@
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
@@ -11,12 +12,23 @@ BroadcastResult = tuple[int, int]
 BroadcastDetailResult = tuple[int, int, int]
 
 
+@dataclass(slots=True, frozen=True)
 class BroadcastTarget:
     """广播目标"""
 
-    def __init__(self, group_id: str, channel_id: str | None = None):
-        self.group_id = group_id
-        self.channel_id = channel_id
+    group_id: str
+    channel_id: str | None = None
+    key: str = field(init=False)
+    """群组的唯一标识，构造时计算一次"""
+
+    def __post_init__(self):
+        object.__setattr__(
+            self,
+            "key",
+            f"{self.group_id}:{self.channel_id}"
+            if self.channel_id
+            else str(self.group_id),
+        )
 
     def to_dict(self) -> dict[str, str | None]:
         """转换为字典格式"""
@@ -27,17 +39,19 @@ class BroadcastTarget:
         """从 GroupConsole 对象创建"""
         return cls(group_id=group.group_id, channel_id=group.channel_id)
 
-    @property
-    def key(self) -> str:
-        """获取群组的唯一标识"""
-        if self.channel_id:
-            return f"{self.group_id}:{self.channel_id}"
-        return str(self.group_id)
-
 
 class BroadcastTask:
     """广播任务"""
 
+    __slots__ = (
+        "_serialized",
+        "bot_id",
+        "message",
+        "scheduled_time",
+        "targets",
+        "task_id",
+    )
+
     def __init__(
         self,
         bot_id: str,
@@ -51,14 +65,17 @@ class BroadcastTask:
         self.targets = targets
         self.scheduled_time = scheduled_time
         self.task_id = task_id
+        self._serialized: dict[str, Any] | None = None
 
     def to_dict(self) -> dict[str, Any]:
-        """转换为字典格式，用于序列化"""
-        return {
-            "bot_id": self.bot_id,
-            "targets": [t.to_dict() for t in self.targets],
-            "scheduled_time": self.scheduled_time.isoformat()
-            if self.scheduled_time
-            else None,
-            "task_id": self.task_id,
-        }
+        """转换为字典格式，用于序列化，结果在首次调用后缓存"""
+        if self._serialized is None:
+            self._serialized = {
+                "bot_id": self.bot_id,
+                "targets": [t.to_dict() for t in self.targets],
+                "scheduled_time": self.scheduled_time.isoformat()
+                if self.scheduled_time
+                else None,
+                "task_id": self.task_id,
+            }
+        return self._serialized
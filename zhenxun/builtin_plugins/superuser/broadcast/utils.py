@@ -1,4 +1,6 @@
 import base64
+import contextlib
+import weakref
 
 import nonebot_plugin_alconna as alc
 from nonebot_plugin_alconna import UniMessage
@@ -7,6 +9,21 @@ from nonebot_plugin_alconna.uniseg.segment import CustomNode, Video
 
 from zhenxun.services.log import logger
 
+_V11_TRAILING_SEP = {"type": "text", "data": {"text": "\n---\n"}}
+"""嵌套转发节点间的固定分隔段，所有节点共享同一实例"""
+
+_STR_BYTES = (str, bytes)
+
+
+def _raw_to_base64(seg: alc.Segment, raw_data: bytes) -> str:
+    """bytes内容转base64串，缓存在段对象上避免重复编码"""
+    cached = getattr(seg, "_b64_cache", None)
+    if cached is None:
+        cached = f"base64://{base64.b64encode(raw_data).decode()}"
+        with contextlib.suppress(AttributeError):
+            seg._b64_cache = cached
+    return cached
+
 
 def uni_segment_to_v11_segment_dict(
     seg: alc.Segment, depth: int = 0
@@ -23,11 +40,13 @@ def uni_segment_to_v11_segment_dict(
         elif getattr(seg, "raw", None):
             raw_data = seg.raw
             if isinstance(raw_data, str):
-                if len(raw_data) >= 9 and raw_data[:9] == "base64://":
+                if raw_data.startswith("base64://"):
                     return {"type": "image", "data": {"file": raw_data}}
             elif isinstance(raw_data, bytes):
-                b64_str = base64.b64encode(raw_data).decode()
-                return {"type": "image", "data": {"file": f"base64://{b64_str}"}}
+                return {
+                    "type": "image",
+                    "data": {"file": _raw_to_base64(seg, raw_data)},
+                }
             else:
                 logger.warning(f"无法处理 Image.raw 的类型: {type(raw_data)}", "广播")
         elif getattr(seg, "path", None):
@@ -50,11 +69,13 @@ def uni_segment_to_v11_segment_dict(
         elif getattr(seg, "raw", None):
             raw_data = seg.raw
             if isinstance(raw_data, str):
-                if len(raw_data) >= 9 and raw_data[:9] == "base64://":
+                if raw_data.startswith("base64://"):
                     return {"type": "video", "data": {"file": raw_data}}
             elif isinstance(raw_data, bytes):
-                b64_str = base64.b64encode(raw_data).decode()
-                return {"type": "video", "data": {"file": f"base64://{b64_str}"}}
+                return {
+                    "type": "video",
+                    "data": {"file": _raw_to_base64(seg, raw_data)},
+                }
             else:
                 logger.warning(f"无法处理 Video.raw 的类型: {type(raw_data)}", "广播")
         elif getattr(seg, "path", None):
@@ -90,17 +111,18 @@ def uni_segment_to_v11_segment_dict(
                         {"type": "text", "data": {"text": node.content}}
                     )
                 if node_v11_content:
-                    separator = {
-                        "type": "text",
-                        "data": {
-                            "text": f"\n--- 来自 {node.name} ({node.uid}) 的消息 ---\n"
-                        },
-                    }
-                    nested_v11_content_list.insert(0, separator)
-                    nested_v11_content_list.extend(node_v11_content)
                     nested_v11_content_list.append(
-                        {"type": "text", "data": {"text": "\n---\n"}}
+                        {
+                            "type": "text",
+                            "data": {
+                                "text": (
+                                    f"\n--- 来自 {node.name} ({node.uid}) 的消息 ---\n"
+                                )
+                            },
+                        }
                     )
+                    nested_v11_content_list.extend(node_v11_content)
+                    nested_v11_content_list.append(_V11_TRAILING_SEP)
 
         return nested_v11_content_list
 
@@ -109,12 +131,36 @@ def uni_segment_to_v11_segment_dict(
     return None
 
 
+_v11_dicts_cache: dict[int, list[dict]] = {}
+"""UniMessage转换结果缓存，键为消息对象id，随消息回收自动清理"""
+
+
 def uni_message_to_v11_list_of_dicts(uni_msg: UniMessage | str | list) -> list[dict]:
-    """UniMessage转V11字典列表"""
+    """UniMessage转V11字典列表，同一消息对象只做一次类型分派遍历"""
+    if isinstance(uni_msg, UniMessage):
+        cached = _v11_dicts_cache.get(id(uni_msg))
+        if cached is not None:
+            return cached
+    result = _uni_message_to_v11_uncached(uni_msg)
+    if isinstance(uni_msg, UniMessage):
+        try:
+            weakref.finalize(uni_msg, _v11_dicts_cache.pop, id(uni_msg), None)
+        except TypeError:
+            return result
+        _v11_dicts_cache[id(uni_msg)] = result
+    return result
+
+
+def _uni_message_to_v11_uncached(uni_msg: UniMessage | str | list) -> list[dict]:
     try:
         if isinstance(uni_msg, str):
             return [{"type": "text", "data": {"text": uni_msg}}]
 
+        if isinstance(uni_msg, UniMessage) and all(
+            isinstance(seg, alc.Text) for seg in uni_msg
+        ):
+            return [{"type": "text", "data": {"text": seg.text}} for seg in uni_msg]
+
         if isinstance(uni_msg, list):
             if not uni_msg:
                 return []
@@ -124,12 +170,13 @@ def uni_message_to_v11_list_of_dicts(uni_msg: UniMessage | str | list) -> list[d
 
             result = []
             for item in uni_msg:
-                if hasattr(item, "__iter__") and not isinstance(item, str | bytes):
+                is_atomic = isinstance(item, _STR_BYTES)
+                if hasattr(item, "__iter__") and not is_atomic:
                     result.extend(uni_message_to_v11_list_of_dicts(item))
-                elif hasattr(item, "text") and not isinstance(item, str | bytes):
+                elif hasattr(item, "text") and not is_atomic:
                     text_value = getattr(item, "text", "")
                     result.append({"type": "text", "data": {"text": str(text_value)}})
-                elif hasattr(item, "url") and not isinstance(item, str | bytes):
+                elif hasattr(item, "url") and not is_atomic:
                     url_value = getattr(item, "url", "")
                     if isinstance(item, Video):
                         result.append(
@@ -155,7 +202,11 @@ def custom_nodes_to_v11_nodes(custom_nodes: list[CustomNode]) -> list[dict]:
     """CustomNode列表转V11节点"""
     v11_nodes = []
     for node in custom_nodes:
-        v11_content_list = uni_message_to_v11_list_of_dicts(node.content)
+        v11_content_list = getattr(node, "_v11_cache", None)
+        if v11_content_list is None:
+            v11_content_list = uni_message_to_v11_list_of_dicts(node.content)
+            with contextlib.suppress(AttributeError):
+                node._v11_cache = v11_content_list
 
         if v11_content_list:
             v11_nodes.append(
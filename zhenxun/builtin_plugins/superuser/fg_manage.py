@@ -65,9 +65,8 @@ async def _(
     try:
         # TODO: 其他adapter的好友api
         fl = await bot.get_friend_list()
-        msg = ["{user_id} {nickname}".format_map(g) for g in fl]
-        msg = "\n".join(msg)
-        msg = f"| UID | 昵称 | 共{len(fl)}个好友\n" + msg
+        body = "\n".join(f"{g['user_id']} {g['nickname']}" for g in fl)
+        msg = f"| UID | 昵称 | 共{len(fl)}个好友\n{body}"
         await MessageUtils.build_message(msg).send()
         logger.info("查看好友列表", "好友列表", session=session)
     except Exception as e:
@@ -83,9 +82,8 @@ async def _(
     try:
         # TODO: 其他adapter的群组api
         gl = await bot.get_group_list()
-        msg = ["{group_id} {group_name}".format_map(g) for g in gl]
-        msg = "\n".join(msg)
-        msg = f"| GID | 名称 | 共{len(gl)}个群组\n" + msg
+        body = "\n".join(f"{g['group_id']} {g['group_name']}" for g in gl)
+        msg = f"| GID | 名称 | 共{len(gl)}个群组\n{body}"
         await MessageUtils.build_message(msg).send()
         logger.info("查看群组列表", "群组列表", session=session)
     except Exception as e:
@@ -1,3 +1,5 @@
+import time
+
 from nonebot.adapters import Bot
 from nonebot.adapters.onebot.v11 import Bot as v11Bot
 from nonebot.params import Depends
@@ -124,6 +126,29 @@ _matcher.shortcut(
 )
 
 
+_GROUP_ID_CACHE_TTL = 30
+
+_group_id_cache: tuple[float, set[int]] | None = None
+
+
+async def _group_ids(bot: v11Bot) -> set[int]:
+    """获取bot群组id集合，短时缓存避免重复调用群列表接口
+
+    参数:
+        bot: Bot
+
+    返回:
+        set[int]: 群组id集合
+    """
+    global _group_id_cache
+    now = time.monotonic()
+    if _group_id_cache and now - _group_id_cache[0] < _GROUP_ID_CACHE_TTL:
+        return _group_id_cache[1]
+    group_ids = {g["group_id"] for g in await bot.get_group_list()}
+    _group_id_cache = (now, group_ids)
+    return group_ids
+
+
 def CheckGroupId():
     """
     检测群组id
@@ -187,8 +212,7 @@ async def _(session: EventSession, arparma: Arparma, state: T_State):
 @_matcher.assign("del-group")
 async def _(bot: Bot, session: EventSession, arparma: Arparma, group_id: int):
     if isinstance(bot, v11Bot):
-        group_list = [g["group_id"] for g in await bot.get_group_list()]
-        if group_id not in group_list:
+        if group_id not in await _group_ids(bot):
             logger.debug("群组不存在", "退群", session=session, target=group_id)
             await MessageUtils.build_message(
                 f"{BotConfig.self_nickname}未在该群组中..."
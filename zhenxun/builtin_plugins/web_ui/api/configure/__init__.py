@@ -13,6 +13,7 @@ import nonebot
 from zhenxun.configs.config import BotConfig, Config
 
 from ...base_model import Result
+from ...utils import _TRAVERSAL_RE
 from .data_source import test_db_connection
 from .model import Setting
 
@@ -48,7 +49,7 @@ async def _(setting: Setting) -> Result:
             # 清理和验证数据库路径
             db_path_str = setting.db_url.split(":")[-1].strip()
             # 移除任何可能的路径遍历尝试
-            db_path_str = re.sub(r"[\\/]\.\.[\\/]", "", db_path_str)
+            db_path_str = _TRAVERSAL_RE.sub("", db_path_str)
             # 规范化路径
             db_path = Path(db_path_str).resolve()
             parent_path = db_path.parent
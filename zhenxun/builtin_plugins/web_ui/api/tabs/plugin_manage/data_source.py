@@ -1,8 +1,10 @@
-import re
+import types
+import typing
 
 import cattrs
 from fastapi import Query
-from tortoise.exceptions import DoesNotExist
+from tortoise import Tortoise
+from tortoise.transactions import in_transaction
 
 from zhenxun.configs.config import Config
 from zhenxun.configs.utils import ConfigGroup
@@ -32,33 +34,61 @@ class ApiDataSource:
         返回:
             list[PluginInfo]: 插件数据列表
         """
-        plugin_list: list[PluginInfo] = []
         query = DbPluginInfo
         if plugin_type:
             query = query.filter(plugin_type__in=plugin_type, load_status=True)
         if menu_type:
             query = query.filter(menu_type=menu_type, load_status=True)
-        plugins = await query.all()
-        for plugin in plugins:
-            plugin_info = PluginInfo(
-                module=plugin.module,
-                plugin_name=plugin.name,
-                default_status=plugin.default_status,
-                limit_superuser=plugin.limit_superuser,
-                cost_gold=plugin.cost_gold,
-                menu_type=plugin.menu_type,
-                version=plugin.version or "0",
-                level=plugin.level,
-                status=plugin.status,
-                author=plugin.author,
-                block_type=plugin.block_type,
-                is_builtin="builtin_plugins" in plugin.module_path
-                or plugin.plugin_type == PluginType.HIDDEN,
-                allow_setting=plugin.plugin_type != PluginType.HIDDEN,
-                allow_switch=plugin.plugin_type != PluginType.HIDDEN,
+        rows = await query.all().values_list(
+            "module",
+            "name",
+            "default_status",
+            "limit_superuser",
+            "cost_gold",
+            "menu_type",
+            "version",
+            "level",
+            "status",
+            "author",
+            "block_type",
+            "module_path",
+            "plugin_type",
+        )
+        # 数据来自数据库且字段已类型化，用 model_construct 跳过冗余校验
+        return [
+            PluginInfo.model_construct(
+                module=module,
+                plugin_name=name,
+                default_status=default_status,
+                limit_superuser=limit_superuser,
+                cost_gold=cost_gold,
+                menu_type=menu_type_,
+                version=version or "0",
+                level=level,
+                status=status,
+                author=author,
+                block_type=block_type,
+                is_builtin="builtin_plugins" in module_path
+                or db_plugin_type == PluginType.HIDDEN,
+                allow_setting=db_plugin_type != PluginType.HIDDEN,
+                allow_switch=db_plugin_type != PluginType.HIDDEN,
             )
-            plugin_list.append(plugin_info)
-        return plugin_list
+            for (
+                module,
+                name,
+                default_status,
+                limit_superuser,
+                cost_gold,
+                menu_type_,
+                version,
+                level,
+                status,
+                author,
+                block_type,
+                module_path,
+                db_plugin_type,
+            ) in rows
+        ]
 
     @classmethod
     async def update_plugin(cls, param: UpdatePlugin) -> DbPluginInfo:
@@ -101,74 +131,68 @@ class ApiDataSource:
         返回:
             dict: 更新结果, 例如 {'success': True, 'updated_count': 5, 'errors': []}
         """
-        plugins_to_update_other_fields = []
-        other_update_fields = set()
-        updated_count = 0
+        changed_plugins: list[DbPluginInfo] = []
+        update_fields: set[str] = set()
         errors = []
 
+        modules = [item.module for item in params.updates]
+        by_module = {
+            plugin.module: plugin
+            for plugin in await DbPluginInfo.filter(module__in=modules)
+        }
+
         for item in params.updates:
             try:
-                db_plugin = await DbPluginInfo.get(module=item.module)
-                plugin_changed_other = False
-                plugin_changed_block = False
+                db_plugin = by_module.get(item.module)
+                if not db_plugin:
+                    errors.append({"module": item.module, "error": "Plugin not found"})
+                    continue
+                plugin_changed = False
 
                 if db_plugin.block_type != item.block_type:
                     db_plugin.block_type = item.block_type
                     db_plugin.status = item.block_type != BlockType.ALL
-                    plugin_changed_block = True
+                    update_fields.update(("block_type", "status"))
+                    plugin_changed = True
 
                 if item.menu_type is not None and db_plugin.menu_type != item.menu_type:
                     db_plugin.menu_type = item.menu_type
-                    other_update_fields.add("menu_type")
-                    plugin_changed_other = True
+                    update_fields.add("menu_type")
+                    plugin_changed = True
 
                 if (
                     item.default_status is not None
                     and db_plugin.default_status != item.default_status
                 ):
                     db_plugin.default_status = item.default_status
-                    other_update_fields.add("default_status")
-                    plugin_changed_other = True
-
-                if plugin_changed_block:
-                    try:
-                        await db_plugin.save(update_fields=["block_type", "status"])
-                        updated_count += 1
-                    except Exception as e_save:
-                        errors.append(
-                            {
-                                "module": item.module,
-                                "error": f"Save block_type failed: {e_save!s}",
-                            }
-                        )
-                        plugin_changed_other = False
-
-                if plugin_changed_other:
-                    plugins_to_update_other_fields.append(db_plugin)
-
-            except DoesNotExist:
-                errors.append({"module": item.module, "error": "Plugin not found"})
+                    update_fields.add("default_status")
+                    plugin_changed = True
+
+                if plugin_changed:
+                    changed_plugins.append(db_plugin)
+
             except Exception as e:
                 errors.append({"module": item.module, "error": str(e)})
 
-        bulk_updated_count = 0
-        if plugins_to_update_other_fields and other_update_fields:
+        updated_count = 0
+        if changed_plugins and update_fields:
             try:
-                await DbPluginInfo.bulk_update(
-                    plugins_to_update_other_fields, list(other_update_fields)
-                )
-                bulk_updated_count = len(plugins_to_update_other_fields)
+                async with in_transaction():
+                    await DbPluginInfo.bulk_update(
+                        changed_plugins, list(update_fields), batch_size=1000
+                    )
+                updated_count = len(changed_plugins)
             except Exception as e_bulk:
                 errors.append(
                     {
-                        "module": "batch_update_other",
+                        "module": "batch_update",
                         "error": f"Bulk update failed: {e_bulk!s}",
                     }
                 )
 
         return {
             "success": len(errors) == 0,
-            "updated_count": updated_count + bulk_updated_count,
+            "updated_count": updated_count,
             "errors": errors,
         }
 
@@ -188,15 +212,26 @@ class ApiDataSource:
         """
         type_str = ""
         type_inner = None
-        if r := re.search(r"<class '(.*)'>", str(config.configs[cfg].type)):
-            type_str = r[1]
-        elif r := re.search(r"typing\.(.*)\[(.*)\]", str(config.configs[cfg].type)):
-            type_str = r[1]
-            if type_str:
-                type_str = type_str.lower()
-            type_inner = r[2]
-            if type_inner:
-                type_inner = [x.strip() for x in type_inner.split(",")]
+        cfg_type = config.configs[cfg].type
+        if cfg_type is not None:
+            origin = typing.get_origin(cfg_type)
+            if origin is None:
+                if isinstance(cfg_type, type):
+                    type_str = cfg_type.__name__
+            else:
+                args = typing.get_args(cfg_type)
+                if origin in (typing.Union, types.UnionType):
+                    # 与旧版payload保持一致：Optional[X]输出optional且内部
+                    # 类型不含NoneType，X | Y与typing.Union统一输出union
+                    if type(None) in args:
+                        type_str = "optional"
+                        args = tuple(a for a in args if a is not type(None))
+                    else:
+                        type_str = "union"
+                else:
+                    type_str = getattr(origin, "__name__", str(origin)).lower()
+                if args:
+                    type_inner = [getattr(a, "__name__", str(a)) for a in args]
         return PluginConfig(
             module=module,
             key=cfg,
@@ -227,20 +262,30 @@ class ApiDataSource:
                 "info": "新旧名称相同，无需更新",
             }
 
-        # 检查新名称是否已存在（理论上前端会校验，后端再保险一次）
-        exists = await DbPluginInfo.filter(menu_type=new_name).exists()
-        if exists:
-            raise ValueError(f"新的菜单类型名称 '{new_name}' 已被其他插件使用")
-
         try:
-            # 使用 filter().update() 进行批量更新
-            updated_count = await DbPluginInfo.filter(menu_type=old_name).update(
-                menu_type=new_name
+            # 更新与新名称占用检查合并为一条语句，热路径仅一次数据库往返
+            db = Tortoise.get_connection("default")
+            dialect = db.capabilities.dialect
+            if dialect == "postgres":
+                p1, p2, p3 = "$1", "$2", "$3"
+            else:
+                p1 = p2 = p3 = "?" if dialect == "sqlite" else "%s"
+            # 子查询包一层派生表，规避MySQL不允许UPDATE引用自身表(1093)
+            updated_count, _ = await db.execute_query(
+                f"UPDATE plugin_info SET menu_type = {p1}"
+                f" WHERE menu_type = {p2} AND NOT EXISTS"
+                f" (SELECT 1 FROM (SELECT 1 FROM plugin_info"
+                f" WHERE menu_type = {p3}) AS occupied)",
+                [new_name, old_name, new_name],
             )
-            return {"success": True, "updated_count": updated_count}
         except Exception as e:
             # 可以添加更详细的日志记录
             raise RuntimeError(f"数据库更新菜单类型失败: {e!s}")
+        if not updated_count and await DbPluginInfo.filter(
+            menu_type=new_name
+        ).exists():
+            raise ValueError(f"新的菜单类型名称 '{new_name}' 已被其他插件使用")
+        return {"success": True, "updated_count": updated_count}
 
     @classmethod
     async def get_plugin_detail(cls, module: str) -> PluginDetail:
@@ -12,6 +12,7 @@ from ..base_model import Result
 from ..utils import (
     ACCESS_TOKEN_EXPIRE_MINUTES,
     create_token,
+    ensure_token_loaded,
     get_user,
     token_data,
     token_file,
@@ -38,6 +39,7 @@ async def login_get_token(form_data: OAuth2PasswordRequestForm = Depends()):
         user=user,
         expires_delta=timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES),
     )
+    await ensure_token_loaded()
     token_data["token"].append(access_token)
     if len(token_data["token"]) > 3:
         token_data["token"] = token_data["token"][1:]
@@ -1,9 +1,13 @@
+import asyncio
 import contextlib
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 import os
 from pathlib import Path
 import re
+import time
 
+import aiofiles
 from fastapi import Depends, HTTPException
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
@@ -19,14 +23,42 @@ from .base_model import SystemFolderSize, SystemStatus, User
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
+
+@lru_cache(maxsize=8)
+def _web_ui_config(key: str):
+    """缓存web-ui配置项读取，配置重载时失效"""
+    return Config.get_config("web-ui", key)
+
+
+Config.add_reload_listener(_web_ui_config.cache_clear)
+
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/login")
 
+_TRAVERSAL_RE = re.compile(r"[\\/]\.\.[\\/]")
+
+_DANGEROUS_CHARS = frozenset('~*?><|"')
+
 token_file = DATA_PATH / "web_ui" / "token.json"
 token_file.parent.mkdir(parents=True, exist_ok=True)
-token_data = {"token": []}
-if token_file.exists():
-    with contextlib.suppress(json.JSONDecodeError):
-        token_data = json.load(open(token_file, encoding="utf8"))
+token_data: dict = {"token": []}
+
+_token_loaded = False
+_token_load_lock = asyncio.Lock()
+
+
+async def ensure_token_loaded():
+    """懒加载token文件，避免在模块导入时阻塞事件循环"""
+    global _token_loaded
+    if _token_loaded:
+        return
+    async with _token_load_lock:
+        if _token_loaded:
+            return
+        if token_file.exists():
+            with contextlib.suppress(json.JSONDecodeError):
+                async with aiofiles.open(token_file, "rb") as f:
+                    token_data.update(json.loads(await f.read()))
+        _token_loaded = True
 
 
 def validate_path(path_str: str | None) -> tuple[Path | None, str | None]:
@@ -43,7 +75,7 @@ def validate_path(path_str: str | None) -> tuple[Path | None, str | None]:
             return Path().resolve(), None
 
         # 1. 移除任何可能的路径遍历尝试
-        path_str = re.sub(r"[\\/]\.\.[\\/]", "", path_str)
+        path_str = _TRAVERSAL_RE.sub("", path_str)
 
         # 2. 规范化路径并转换为绝对路径
         path = Path(path_str).resolve()
@@ -59,11 +91,13 @@ def validate_path(path_str: str | None) -> tuple[Path | None, str | None]:
             return None, "无效的路径格式"
 
         # 5. 验证路径是否包含任何危险字符
-        if any(c in str(path) for c in ["..", "~", "*", "?", ">", "<", "|", '"']):
+        # resolve() 已折叠 ".."，仅需单次线性扫描危险字符集合
+        path_str = str(path)
+        if ".." in path_str or not _DANGEROUS_CHARS.isdisjoint(path_str):
             return None, "路径包含非法字符"
 
         # 6. 验证路径长度是否合理
-        return (None, "路径长度超出限制") if len(str(path)) > 4096 else (path, None)
+        return (None, "路径长度超出限制") if len(path_str) > 4096 else (path, None)
     except Exception as e:
         return None, f"路径验证失败: {e!s}"
 
@@ -73,15 +107,33 @@ SIMPLE_HELP_IMAGE = IMAGE_PATH / "SIMPLE_HELP.png"
 SIMPLE_DETAIL_HELP_IMAGE = IMAGE_PATH / "SIMPLE_DETAIL_HELP.png"
 
 
-def clear_help_image():
-    """清理帮助图片"""
+def _do_clear_help_image():
+    """实际执行帮助图片清理，应在工作线程中运行"""
     if SIMPLE_HELP_IMAGE.exists():
         SIMPLE_HELP_IMAGE.unlink()
     if SIMPLE_DETAIL_HELP_IMAGE.exists():
         SIMPLE_DETAIL_HELP_IMAGE.unlink()
-    for file in GROUP_HELP_PATH.iterdir():
-        if file.is_file():
-            file.unlink()
+    with os.scandir(GROUP_HELP_PATH) as entries:
+        for entry in entries:
+            if entry.is_file():
+                os.unlink(entry.path)
+
+
+def clear_help_image():
+    """清理帮助图片，后台线程执行避免大量unlink阻塞事件循环"""
+    # 批量更新/重命名等写入路径不触发Tortoise信号，这里一并失效插件列表缓存，
+    # 否则重新生成的帮助图会基于过期数据
+    from zhenxun.builtin_plugins.help._utils import invalidate_plugin_cache
+
+    invalidate_plugin_cache()
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        _do_clear_help_image()
+    else:
+        loop.create_task(  # noqa: RUF006
+            asyncio.to_thread(_do_clear_help_image)
+        )
 
 
 def get_user(uname: str) -> User | None:
@@ -93,8 +145,8 @@ def get_user(uname: str) -> User | None:
     返回:
         Optional[User]: 用户信息
     """
-    username = Config.get_config("web-ui", "username")
-    password = Config.get_config("web-ui", "password")
+    username = _web_ui_config("username")
+    password = _web_ui_config("password")
     if username and password and uname == username:
         return User(username=username, password=password)
 
@@ -109,11 +161,27 @@ def create_token(user: User, expires_delta: timedelta | None = None):
     expire = datetime.now(timezone.utc) + (expires_delta or timedelta(minutes=15))
     return jwt.encode(
         claims={"sub": user.username, "exp": expire},
-        key=Config.get_config("web-ui", "secret"),
+        key=_web_ui_config("secret"),
         algorithm=ALGORITHM,
     )
 
 
+_TOKEN_CACHE: dict[str, tuple[float, str]] = {}
+"""已验证token缓存，token -> (过期时间戳, 用户名)，命中时跳过HMAC校验"""
+
+_TOKEN_CACHE_SIZE = 1024
+
+
+def _cache_token(token: str, exp_ts: float, username: str):
+    if len(_TOKEN_CACHE) >= _TOKEN_CACHE_SIZE:
+        now = time.time()
+        for key in [k for k, (exp, _) in _TOKEN_CACHE.items() if exp <= now]:
+            _TOKEN_CACHE.pop(key, None)
+        while len(_TOKEN_CACHE) >= _TOKEN_CACHE_SIZE:
+            _TOKEN_CACHE.pop(next(iter(_TOKEN_CACHE)))
+    _TOKEN_CACHE[token] = (exp_ts, username)
+
+
 def authentication():
     """权限验证
 
@@ -125,10 +193,16 @@ def authentication():
     # if token not in token_data["token"]:
     def inner(token: str = Depends(oauth2_scheme)):
         try:
-            payload = jwt.decode(
-                token, Config.get_config("web-ui", "secret"), algorithms=[ALGORITHM]
-            )
-            username, _ = payload.get("sub"), payload.get("exp")
+            cached = _TOKEN_CACHE.get(token)
+            if cached and time.time() < cached[0]:
+                username = cached[1]
+            else:
+                payload = jwt.decode(
+                    token, _web_ui_config("secret"), algorithms=[ALGORITHM]
+                )
+                username, exp = payload.get("sub"), payload.get("exp")
+                if username and exp:
+                    _cache_token(token, float(exp), username)
             user = get_user(username)  # type: ignore
             if user is None:
                 raise JWTError
@@ -146,10 +220,36 @@ def _get_dir_size(dir_path: Path) -> float:
     参数:
         dir_path: 文件夹路径
     """
-    return sum(
-        sum(os.path.getsize(os.path.join(root, name)) for name in files)
-        for root, dirs, files in os.walk(dir_path)
-    )
+    total = 0
+    stack = [str(dir_path)]
+    while stack:
+        # 与os.walk一致地忽略无权限等读取失败，单个坏文件不影响统计
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        else:
+                            total += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return total
+
+
+_disk_cache: list[float] = [0.0, 0.0]
+"""磁盘占用率缓存，[上次采样时间, 占用率]"""
+
+
+def _cached_disk_percent(ttl: float = 2.0) -> float:
+    """带TTL的磁盘占用率，高频轮询时避免每次statvfs系统调用"""
+    now = time.monotonic()
+    if now - _disk_cache[0] > ttl:
+        _disk_cache[0] = now
+        _disk_cache[1] = psutil.disk_usage("/").percent
+    return _disk_cache[1]
 
 
 @run_sync
@@ -157,7 +257,7 @@ def get_system_status() -> SystemStatus:
     """获取系统信息等"""
     cpu = psutil.cpu_percent()
     memory = psutil.virtual_memory().percent
-    disk = psutil.disk_usage("/").percent
+    disk = _cached_disk_percent()
     return SystemStatus(
         cpu=cpu,
         memory=memory,
@@ -166,23 +266,27 @@ def get_system_status() -> SystemStatus:
     )
 
 
-@run_sync
-def get_system_disk(
+async def get_system_disk(
     full_path: str | None,
 ) -> list[SystemFolderSize]:
     """获取资源文件大小等"""
     base_path = Path(full_path) if full_path else Path()
     other_size = 0
-    data_list = []
-    for file in os.listdir(base_path):
-        f = base_path / file
+    dirs = []
+    for f in base_path.iterdir():
         if f.is_dir():
-            size = _get_dir_size(f) / 1024 / 1024
-            data_list.append(
-                SystemFolderSize(name=file, size=size, full_path=str(f), is_dir=True)
-            )
+            dirs.append(f)
         else:
             other_size += f.stat().st_size / 1024 / 1024
+    sizes = await asyncio.gather(
+        *(asyncio.to_thread(_get_dir_size, d) for d in dirs)
+    )
+    data_list = [
+        SystemFolderSize(
+            name=d.name, size=size / 1024 / 1024, full_path=str(d), is_dir=True
+        )
+        for d, size in zip(dirs, sizes)
+    ]
     if other_size:
         data_list.append(
             SystemFolderSize(
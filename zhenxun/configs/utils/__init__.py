@@ -304,6 +304,7 @@ class ConfigsManager:
         self._simple_data: dict = {}
         self._simple_file = DATA_PATH / "config.yaml"
         self.add_module = []
+        self._reload_listeners: list[Callable[[], None]] = []
         _yaml = YAML()
         if file:
             file.parent.mkdir(exist_ok=True, parents=True)
@@ -409,6 +410,7 @@ class ConfigsManager:
             self._simple_data[module][key] = value
             if auto_save:
                 self.save(save_simple_data=True)
+            self._notify_reload_listeners()
 
     def get_config(self, module: str, key: str, default: Any = None) -> Any:
         """获取指定配置值
@@ -501,6 +503,19 @@ class ConfigsManager:
         with open(path, "w", encoding="utf8") as f:
             _yaml.dump(data, f)
 
+    def add_reload_listener(self, func: Callable[[], None]):
+        """注册配置重载监听器，配置重载或修改时调用
+
+        参数:
+            func: 回调函数
+        """
+        if func not in self._reload_listeners:
+            self._reload_listeners.append(func)
+
+    def _notify_reload_listeners(self):
+        for func in self._reload_listeners:
+            func()
+
     def reload(self):
         """重新加载配置文件"""
         if self._simple_file.exists():
@@ -510,6 +525,7 @@ class ConfigsManager:
             for k in self._simple_data[key].keys():
                 self._data[key].configs[k].value = self._simple_data[key][k]
         self.save()
+        self._notify_reload_listeners()
 
     def load_data(self):
         """加载数据
@@ -27,3 +27,8 @@ class BotMessageStore(Model):
     class Meta:  # pyright: ignore [reportIncompatibleVariableOverride]
         table = "bot_message_store"
         table_description = "Bot发送消息列表"
+        indexes = (
+            ("bot_id", "create_time"),
+            ("group_id", "create_time"),
+            ("user_id", "create_time"),
+        )
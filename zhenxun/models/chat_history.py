@@ -58,6 +58,38 @@ class ChatHistory(Model):
             .values_list("user_id", "count")
         )  # type: ignore
 
+    @classmethod
+    async def get_group_msg_rank_with_name(
+        cls,
+        gid: str | None,
+        limit: int = 10,
+        order: str = "DESC",
+        date_scope: tuple[datetime, datetime] | None = None,
+    ) -> list[tuple[str, int, str | None]]:
+        """获取排行数据并附带群昵称
+
+        参数:
+            gid: 群号
+            limit: 获取数量
+            order: 排序类型，desc，des
+            date_scope: 日期范围
+
+        返回:
+            list[tuple[str, int, str | None]]: (用户id, 发言数, 群昵称)，
+                用户已不在群内时群昵称为None
+        """
+        from zhenxun.models.group_member_info import GroupInfoUser
+
+        rank_data = await cls.get_group_msg_rank(gid, limit, order, date_scope)
+        if not rank_data:
+            return []
+        name_data = dict(
+            await GroupInfoUser.filter(
+                user_id__in=[uid for uid, _ in rank_data], group_id=gid
+            ).values_list("user_id", "user_name")
+        )
+        return [(uid, num, name_data.get(uid)) for uid, num in rank_data]
+
     @classmethod
     async def get_group_first_msg_datetime(
         cls, group_id: str | None
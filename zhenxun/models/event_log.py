@@ -19,3 +19,4 @@ class EventLog(Model):
     class Meta:  # pyright: ignore [reportIncompatibleVariableOverride]
         table = "event_log"
         table_description = "各种请求通知记录表"
+        indexes = (("user_id", "create_time"), ("group_id", "event_type"))
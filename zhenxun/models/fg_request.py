@@ -1,3 +1,4 @@
+import asyncio
 from typing_extensions import Self
 
 from nonebot.adapters import Bot
@@ -42,6 +43,11 @@ class FgRequest(Model):
     class Meta:  # pyright: ignore [reportIncompatibleVariableOverride]
         table = "fg_request"
         table_description = "好友群组请求"
+        indexes = (
+            ("handle_type",),
+            ("user_id", "request_type"),
+            ("group_id", "request_type"),
+        )
 
     @classmethod
     async def approve(cls, bot: Bot, id: int) -> Self:
@@ -119,29 +125,86 @@ class FgRequest(Model):
             RequestHandleType.IGNORE,
             RequestHandleType.EXPIRE,
         ]:
-            if req.request_type == RequestType.FRIEND:
-                await bot.set_friend_add_request(
-                    flag=req.flag, approve=handle_type == RequestHandleType.APPROVE
+            await cls._notify_platform(bot, req, handle_type)
+        return req
+
+    @classmethod
+    async def _notify_platform(
+        cls, bot: Bot, req: Self, handle_type: RequestHandleType
+    ):
+        """向平台回执请求处理结果
+
+        参数:
+            bot: Bot
+            req: 请求数据
+            handle_type: 处理类型
+        """
+        if req.request_type == RequestType.FRIEND:
+            await bot.set_friend_add_request(
+                flag=req.flag, approve=handle_type == RequestHandleType.APPROVE
+            )
+        else:
+            # unique_together 中 channel_id 可空，NULL 不参与冲突判定，
+            # 无法安全使用 ON CONFLICT 单语句 upsert，退而先 UPDATE 后 INSERT，
+            # 命中已有群组时仅一次数据库往返
+            if not await GroupConsole.filter(group_id=req.group_id).update(
+                group_flag=1
+            ):
+                await GroupConsole.create(group_id=req.group_id, group_flag=1)
+            if req.flag == "0":
+                # 用户手动申请入群，创建群认证后提醒用户拉群
+                await bot.send_private_msg(
+                    user_id=req.user_id,
+                    message=f"已同意你对{BotConfig.self_nickname}的申请群组："
+                    f"{req.group_id}，可以直接手动拉入群组，{BotConfig.self_nickname}会自动同意。",
                 )
             else:
-                await GroupConsole.update_or_create(
-                    group_id=req.group_id, defaults={"group_flag": 1}
+                # 正常同意群组请求
+                await bot.set_group_add_request(
+                    flag=req.flag,
+                    sub_type="invite",
+                    approve=handle_type == RequestHandleType.APPROVE,
                 )
-                if req.flag == "0":
-                    # 用户手动申请入群，创建群认证后提醒用户拉群
-                    await bot.send_private_msg(
-                        user_id=req.user_id,
-                        message=f"已同意你对{BotConfig.self_nickname}的申请群组："
-                        f"{req.group_id}，可以直接手动拉入群组，{BotConfig.self_nickname}会自动同意。",
-                    )
-                else:
-                    # 正常同意群组请求
-                    await bot.set_group_add_request(
-                        flag=req.flag,
-                        sub_type="invite",
-                        approve=handle_type == RequestHandleType.APPROVE,
-                    )
-        return req
+
+    @classmethod
+    async def bulk_handle(
+        cls,
+        bot: Bot | None,
+        ids: list[int],
+        handle_type: RequestHandleType,
+        max_concurrency: int = 8,
+    ) -> list[Self]:
+        """批量处理请求，单次批量更新代替逐条fetch-save
+
+        参数:
+            bot: Bot
+            ids: 请求id列表
+            handle_type: 处理类型
+            max_concurrency: 平台回执最大并发数.
+
+        返回:
+            list[Self]: 处理的请求列表
+        """
+        rows = await cls.filter(id__in=ids).all()
+        if not rows:
+            return []
+        for row in rows:
+            row.handle_type = handle_type
+        await cls.bulk_update(rows, ["handle_type"], batch_size=500)
+        if bot and handle_type not in [
+            RequestHandleType.IGNORE,
+            RequestHandleType.EXPIRE,
+        ]:
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def _notify(req: Self):
+                async with semaphore:
+                    await cls._notify_platform(bot, req, handle_type)
+
+            await asyncio.gather(
+                *(_notify(row) for row in rows), return_exceptions=True
+            )
+        return rows
 
     @classmethod
     async def _run_script(cls):
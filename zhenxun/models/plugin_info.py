@@ -58,6 +58,7 @@ class PluginInfo(Model):
     class Meta:  # pyright: ignore [reportIncompatibleVariableOverride]
         table = "plugin_info"
         table_description = "插件基本信息"
+        indexes = (("plugin_type", "load_status"), ("menu_type",))
 
     @classmethod
     async def get_plugin(
@@ -1,5 +1,7 @@
+from collections.abc import Callable
 from datetime import timedelta
 from typing import Any, overload
+import weakref
 
 import nonebot
 from nonebot import require
@@ -16,6 +18,103 @@ driver = nonebot.get_driver()
 
 log_level = driver.config.log_level or "INFO"
 
+_LEVEL_NOS = {
+    lvl: logger_.level(lvl.upper()).no
+    for lvl in ("trace", "debug", "info", "success", "warning", "error")
+}
+"""级别名到级别号映射，供 _log 提前过滤被忽略的记录"""
+
+_MIN_LEVEL_NO = (
+    logger_.level(log_level).no if isinstance(log_level, str) else int(log_level)
+)
+"""生效的最低级别号，与 default_filter 的判定保持一致"""
+
+
+def _adapter_part(adapter) -> str:
+    return f"Adapter[<m>{adapter}</m>] " if adapter else ""
+
+
+def _platform_part(platform) -> str:
+    return f"平台[<u><m>{platform}</m></u>] " if platform else ""
+
+
+def _group_part(group_id) -> str:
+    return f"群聊[<u><e>{group_id}</e></u>] " if group_id else ""
+
+
+def _user_part(user_id) -> str:
+    return f"用户[<u><e>{user_id}</e></u>] " if user_id else ""
+
+
+def _command_part(command) -> str:
+    return f"CMD[<u><c>{command}</c></u>] " if command else ""
+
+
+def _target_part(target) -> str:
+    return f"[Target]([<u><e>{target}</e></u>]) " if target else ""
+
+
+_session_ctx_cache: dict[int, tuple] = {}
+"""session对象id到已解析上下文的缓存，同一对象多次打日志时免去属性遍历"""
+
+
+def _cache_session_ctx(session, ctx: tuple):
+    key = id(session)
+    try:
+        weakref.finalize(session, _session_ctx_cache.pop, key, None)
+    except TypeError:
+        return
+    _session_ctx_cache[key] = ctx
+
+
+def _unpack_scalar(session, adapter, group_id, platform):
+    return str(session), adapter, group_id, platform
+
+
+def _unpack_session(session, adapter, group_id, platform):
+    raw = _session_ctx_cache.get(id(session))
+    if raw is None:
+        raw = (
+            session.id1,
+            session.bot_type,
+            f"{session.id3}:{session.id2}" if session.id3 else session.id2,
+            session.platform,
+        )
+        _cache_session_ctx(session, raw)
+    return raw[0], raw[1], raw[2], platform or raw[3]
+
+
+def _unpack_uninfo(session, adapter, group_id, platform):
+    raw = _session_ctx_cache.get(id(session))
+    if raw is None:
+        raw = (
+            session.user.id,
+            session.adapter,
+            session.group.id if session.group else None,
+            session.basic.get("scope"),
+        )
+        _cache_session_ctx(session, raw)
+    return raw[0], raw[1], raw[2] if raw[2] else group_id, raw[3]
+
+
+_SESSION_UNPACK: dict[type, Callable] = {
+    int: _unpack_scalar,
+    str: _unpack_scalar,
+    Session: _unpack_session,
+    uninfoSession: _unpack_uninfo,
+}
+"""session具体类型到解析函数映射，精确类型命中免去isinstance链"""
+
+_LEVEL_NAMES = ("trace", "debug", "info", "success", "warning", "error")
+
+_COLOR_LOGFUNCS = {
+    lvl: getattr(logger_.opt(colors=True), lvl) for lvl in _LEVEL_NAMES
+}
+"""着色输出的已绑定日志方法，免去每次opt()复制与getattr"""
+
+_PLAIN_LOGFUNCS = {lvl: getattr(logger_, lvl) for lvl in _LEVEL_NAMES}
+"""着色失败时的降级日志方法"""
+
 logger_.add(
     LOG_PATH / "{time:YYYY-MM-DD}.log",
     level=log_level,
@@ -23,6 +122,7 @@ logger_.add(
     format=default_format,
     filter=default_filter,
     retention=timedelta(days=30),
+    enqueue=True,
 )
 
 logger_.add(
@@ -32,6 +132,7 @@ logger_.add(
     format=default_format,
     filter=default_filter,
     retention=timedelta(days=30),
+    enqueue=True,
 )
 
 
@@ -40,12 +141,6 @@ class logger:
     一个经过优化的、支持多种上下文和格式的日志记录器。
     """
 
-    TEMPLATE_ADAPTER = "Adapter[<m>{}</m>]"
-    TEMPLATE_USER = "用户[<u><e>{}</e></u>]"
-    TEMPLATE_GROUP = "群聊[<u><e>{}</e></u>]"
-    TEMPLATE_COMMAND = "CMD[<u><c>{}</c></u>]"
-    TEMPLATE_PLATFORM = "平台[<u><m>{}</m></u>]"
-    TEMPLATE_TARGET = "[Target]([<u><e>{}</e></u>])"
     SUCCESS_TEMPLATE = "[<u><c>{}</c></u>]: {} | 参数[{}] 返回: [<y>{}</y>]"
 
     @classmethod
@@ -60,24 +155,13 @@ class logger:
         platform: str | None = None,
     ) -> str:
         """
-        优化后的模板解析器，构建并连接日志信息片段。
+        优化后的模板解析器，单次f-string拼接日志信息片段。
         """
-        parts = []
-        if adapter:
-            parts.append(cls.TEMPLATE_ADAPTER.format(adapter))
-        if platform:
-            parts.append(cls.TEMPLATE_PLATFORM.format(platform))
-        if group_id:
-            parts.append(cls.TEMPLATE_GROUP.format(group_id))
-        if user_id:
-            parts.append(cls.TEMPLATE_USER.format(user_id))
-        if command:
-            parts.append(cls.TEMPLATE_COMMAND.format(command))
-        if target:
-            parts.append(cls.TEMPLATE_TARGET.format(target))
-
-        parts.append(info)
-        return " ".join(parts)
+        return (
+            f"{_adapter_part(adapter)}{_platform_part(platform)}"
+            f"{_group_part(group_id)}{_user_part(user_id)}"
+            f"{_command_part(command)}{_target_part(target)}{info}"
+        )
 
     @classmethod
     def _log(
@@ -95,19 +179,27 @@ class logger:
         """
         核心日志处理方法，处理所有日志级别的通用逻辑。
         """
-        user_id: str | None = str(session) if isinstance(session, int | str) else None
-
-        if isinstance(session, Session):
-            user_id = session.id1
-            adapter = session.bot_type
-            group_id = f"{session.id3}:{session.id2}" if session.id3 else session.id2
-            platform = platform or session.platform
-        elif isinstance(session, uninfoSession):
-            user_id = session.user.id
-            adapter = session.adapter
-            if session.group:
-                group_id = session.group.id
-            platform = session.basic.get("scope")
+        level_no = _LEVEL_NOS.get(level)
+        if level_no is not None and level_no < _MIN_LEVEL_NO:
+            return
+
+        user_id: str | None = None
+        if session is not None:
+            unpack = _SESSION_UNPACK.get(type(session))
+            if unpack is None:
+                # 子类首次出现时回退isinstance判定并记入映射，后续O(1)命中
+                if isinstance(session, Session):
+                    unpack = _unpack_session
+                elif isinstance(session, uninfoSession):
+                    unpack = _unpack_uninfo
+                elif isinstance(session, int | str):
+                    unpack = _unpack_scalar
+                if unpack is not None:
+                    _SESSION_UNPACK[type(session)] = unpack
+            if unpack is not None:
+                user_id, adapter, group_id, platform = unpack(
+                    session, adapter, group_id, platform
+                )
 
         template = cls.__parser_template(
             info, command, user_id, group_id, adapter, target, platform
@@ -117,10 +209,16 @@ class logger:
             template += f" || 错误 <r>{type(e).__name__}: {e}</r>"
 
         try:
-            log_func = getattr(logger_.opt(colors=True), level)
+            if "<" in template:
+                log_func = _COLOR_LOGFUNCS.get(level) or getattr(
+                    logger_.opt(colors=True), level
+                )
+            else:
+                # 无着色标记的纯文本直接走普通方法，跳过标记扫描
+                log_func = _PLAIN_LOGFUNCS.get(level) or getattr(logger_, level)
             log_func(template)
         except Exception:
-            log_func_fallback = getattr(logger_, level)
+            log_func_fallback = _PLAIN_LOGFUNCS.get(level) or getattr(logger_, level)
             log_func_fallback(template)
 
     @overload
@@ -1,5 +1,6 @@
 import base64
 import contextlib
+from functools import lru_cache
 from io import BytesIO
 import itertools
 import math
@@ -23,6 +24,25 @@ ModeType = Literal[
 
 ColorAlias: TypeAlias = str | tuple[int, int, int] | tuple[int, int, int, int] | None
 
+@lru_cache(maxsize=64)
+def _circle_mask(size: tuple[int, int]) -> tImage:
+    """按尺寸缓存圆形 alpha 遮罩，避免重复渲染同尺寸圆形"""
+    width = 1
+    antialias = 4
+    ellipse_box = [0, 0, size[0] - 2, size[1] - 2]
+    mask = Image.new(
+        size=[dim * antialias for dim in size],  # type: ignore
+        mode="L",
+        color="black",
+    )
+    draw = ImageDraw.Draw(mask)
+    for offset, fill in (width / -2.0, "black"), (width / 2.0, "white"):
+        left, top = ((value + offset) * antialias for value in ellipse_box[:2])
+        right, bottom = ((value - offset) * antialias for value in ellipse_box[2:])
+        draw.ellipse([left, top, right, bottom], fill=fill)
+    return mask.resize(size, Resampling.LANCZOS)
+
+
 CenterType = Literal["center", "height", "width"]
 """
 粘贴居中
@@ -611,22 +631,8 @@ class BuildImage:
         r2 = min(size[0], size[1])
         if size[0] != size[1]:
             self.markImg = self.markImg.resize((r2, r2), Image.LANCZOS)  # type: ignore
-        width = 1
-        antialias = 4
-        ellipse_box = [0, 0, r2 - 2, r2 - 2]
-        mask = Image.new(
-            size=[int(dim * antialias) for dim in self.markImg.size],  # type: ignore
-            mode="L",
-            color="black",
-        )
-        draw = ImageDraw.Draw(mask)
-        for offset, fill in (width / -2.0, "black"), (width / 2.0, "white"):
-            left, top = ((value + offset) * antialias for value in ellipse_box[:2])
-            right, bottom = ((value - offset) * antialias for value in ellipse_box[2:])
-            draw.ellipse([left, top, right, bottom], fill=fill)
-        mask = mask.resize(self.markImg.size, Resampling.LANCZOS)
         with contextlib.suppress(ValueError):
-            self.markImg.putalpha(mask)
+            self.markImg.putalpha(_circle_mask(self.markImg.size))
         return self
 
     @run_sync
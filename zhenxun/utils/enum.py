@@ -1,4 +1,5 @@
 import sys
+from typing import Final
 
 if sys.version_info >= (3, 11):
     from enum import StrEnum
@@ -89,6 +90,15 @@ class PluginType(StrEnum):
     """父插件，仅仅标记"""
 
 
+PT_SUPERUSER: Final[str] = PluginType.SUPERUSER.value
+PT_ADMIN: Final[str] = PluginType.ADMIN.value
+PT_SUPER_AND_ADMIN: Final[str] = PluginType.SUPER_AND_ADMIN.value
+PT_NORMAL: Final[str] = PluginType.NORMAL.value
+PT_DEPENDANT: Final[str] = PluginType.DEPENDANT.value
+PT_HIDDEN: Final[str] = PluginType.HIDDEN.value
+"""PluginType 各成员的纯字符串常量，热路径比较时省去枚举属性查找"""
+
+
 class BlockType(StrEnum):
     """
     禁用状态
@@ -99,6 +109,12 @@ class BlockType(StrEnum):
     ALL = "ALL"
 
 
+BT_PRIVATE: Final[str] = BlockType.PRIVATE.value
+BT_GROUP: Final[str] = BlockType.GROUP.value
+BT_ALL: Final[str] = BlockType.ALL.value
+"""BlockType 各成员的纯字符串常量，热路径比较时省去枚举属性查找"""
+
+
 class PluginLimitType(StrEnum):
     """
     插件限制类型
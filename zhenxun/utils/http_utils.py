@@ -1,16 +1,18 @@
 import asyncio
+from collections import OrderedDict
 from collections.abc import AsyncGenerator, Sequence
+import contextlib
 from contextlib import asynccontextmanager
+import os
 from pathlib import Path
-import time
-from typing import Any, ClassVar, Literal, cast
+from typing import Any, ClassVar, Literal
 
-import aiofiles
 import httpx
 from httpx import AsyncHTTPTransport, HTTPStatusError, Proxy, Response
+import nonebot
 from nonebot_plugin_alconna import UniMessage
 from nonebot_plugin_htmlrender import get_browser
-from playwright.async_api import Page
+from playwright.async_api import BrowserContext, Page
 from rich.progress import (
     BarColumn,
     DownloadColumn,
@@ -18,13 +20,32 @@ from rich.progress import (
     TextColumn,
     TransferSpeedColumn,
 )
+import ujson as json
 
 from zhenxun.configs.config import BotConfig
 from zhenxun.services.log import logger
 from zhenxun.utils.message import MessageUtils
 from zhenxun.utils.user_agent import get_user_agent
 
-CLIENT_KEY = ["use_proxy", "proxies", "proxy", "verify", "headers"]
+CLIENT_KEY: frozenset[str] = frozenset(
+    ("use_proxy", "proxies", "proxy", "verify", "headers")
+)
+
+
+def _split_client_kwargs(kwargs: dict) -> dict:
+    """单次遍历摘出客户端构造参数并从kwargs中原地移除"""
+    return {k: kwargs.pop(k) for k in tuple(kwargs) if k in CLIENT_KEY}
+
+_DOWNLOAD_BUFFER_SIZE = 1 << 20
+"""流式下载的写入缓冲大小，小块响应先积攒再落盘"""
+
+
+def _write_all(fd: int, data: bytes):
+    """将数据完整写入文件描述符，处理部分写"""
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
 
 
 def get_async_client(
@@ -71,6 +92,12 @@ class AsyncHttpx:
         else None
     )
 
+    _client_pool: ClassVar[dict[tuple, httpx.AsyncClient]] = {}
+    """按客户端配置键复用的连接池，避免每次请求重建TLS与连接"""
+    _CLIENT_POOL_MAX: ClassVar[int] = 16
+    """客户端池上限，超出后新配置退化为一次性客户端，防止无界增长"""
+    _pool_lock: ClassVar[asyncio.Lock] = asyncio.Lock()
+
     @classmethod
     @asynccontextmanager
     async def _create_client(
@@ -101,9 +128,9 @@ class AsyncHttpx:
         """
         proxies_to_use = proxies or (cls.default_proxy if use_proxy else None)
 
-        final_headers = get_user_agent()
-        if headers:
-            final_headers.update(headers)
+        final_headers = (
+            {**get_user_agent(), **headers} if headers else get_user_agent()
+        )
 
         async with get_async_client(
             proxies=proxies_to_use,
@@ -114,6 +141,113 @@ class AsyncHttpx:
         ) as client:
             yield client
 
+    @classmethod
+    def _pool_key(
+        cls,
+        use_proxy: bool,
+        proxies: dict[str, str] | None,
+        proxy: str | None,
+        headers: dict[str, str] | None,
+        verify: bool,
+        kwargs: dict,
+    ) -> tuple | None:
+        """计算客户端配置的缓存键，包含不可散列参数时返回None"""
+        try:
+            key = (
+                use_proxy,
+                tuple(sorted((proxies or {}).items())),
+                proxy,
+                tuple(sorted((headers or {}).items())),
+                verify,
+                tuple(sorted(kwargs.items())),
+            )
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    @classmethod
+    async def _get_pooled_client(
+        cls,
+        *,
+        use_proxy: bool = True,
+        proxies: dict[str, str] | None = None,
+        proxy: str | None = None,
+        headers: dict[str, str] | None = None,
+        verify: bool = False,
+        **kwargs,
+    ) -> httpx.AsyncClient | None:
+        """获取按配置复用的客户端，复用连接池与TLS会话
+
+        参数:
+            use_proxy: 是否使用在类中定义的默认代理。
+            proxies: 手动指定的代理，会覆盖默认代理。
+            proxy: 单个代理,用于兼容旧版本，不再使用
+            headers: 需要合并到客户端的自定义请求头。
+            verify: 是否验证 SSL 证书。
+
+        返回:
+            httpx.AsyncClient | None: 客户端，配置无法作为缓存键时为None
+        """
+        key = cls._pool_key(use_proxy, proxies, proxy, headers, verify, kwargs)
+        if key is None:
+            return None
+        client = cls._client_pool.get(key)
+        if client is None or client.is_closed:
+            async with cls._pool_lock:
+                client = cls._client_pool.get(key)
+                if client is None or client.is_closed:
+                    if client is not None:
+                        cls._client_pool.pop(key, None)
+                    if len(cls._client_pool) >= cls._CLIENT_POOL_MAX:
+                        for k in [
+                            k
+                            for k, c in cls._client_pool.items()
+                            if c.is_closed
+                        ]:
+                            cls._client_pool.pop(k, None)
+                        if len(cls._client_pool) >= cls._CLIENT_POOL_MAX:
+                            # 池已满且均为活跃客户端，不淘汰使用中的连接
+                            return None
+                    proxies_to_use = proxies or (
+                        cls.default_proxy if use_proxy else None
+                    )
+                    final_headers = (
+                        {**get_user_agent(), **headers}
+                        if headers
+                        else get_user_agent()
+                    )
+                    client = get_async_client(
+                        proxies=proxies_to_use,
+                        proxy=proxy,
+                        verify=verify,
+                        headers=final_headers,
+                        **kwargs,
+                    )
+                    cls._client_pool[key] = client
+        return client
+
+    @classmethod
+    @asynccontextmanager
+    async def _borrow_client(
+        cls, **client_kwargs
+    ) -> AsyncGenerator[httpx.AsyncClient, None]:
+        """借用池化客户端，配置不可缓存时退化为一次性客户端"""
+        client = await cls._get_pooled_client(**client_kwargs)
+        if client is not None:
+            yield client
+        else:
+            async with cls._create_client(**client_kwargs) as client:
+                yield client
+
+    @classmethod
+    async def close_client_pool(cls):
+        """关闭并清空池化客户端"""
+        pool, cls._client_pool = cls._client_pool, {}
+        for client in pool.values():
+            with contextlib.suppress(Exception):
+                await client.aclose()
+
     @classmethod
     async def get(
         cls,
@@ -138,30 +272,59 @@ class AsyncHttpx:
             Response: Response
         """
         urls = [url] if isinstance(url, str) else url
+        client_kwargs = _split_client_kwargs(kwargs)
+        if len(urls) == 1:
+            return await cls._get_single(
+                urls[0], check_status_code, client_kwargs, kwargs
+            )
+        # 多镜像并发竞速，第一个成功的响应胜出并取消其余请求
+        tasks = {
+            asyncio.create_task(
+                cls._get_single(current_url, check_status_code, client_kwargs, kwargs)
+            ): current_url
+            for current_url in urls
+        }
+        pending: set[asyncio.Task] = set(tasks)
         last_exception = None
-        for current_url in urls:
-            try:
-                logger.info(f"开始获取 {current_url}..")
-                client_kwargs = {k: v for k, v in kwargs.items() if k in CLIENT_KEY}
-                for key in CLIENT_KEY:
-                    kwargs.pop(key, None)
-                async with cls._create_client(**client_kwargs) as client:
-                    response = await client.get(current_url, **kwargs)
-
-                if check_status_code and response.status_code != check_status_code:
-                    raise HTTPStatusError(
-                        f"状态码错误: {response.status_code}!={check_status_code}",
-                        request=response.request,
-                        response=response,
-                    )
-                return response
-            except Exception as e:
-                last_exception = e
-                if current_url != urls[-1]:
-                    logger.warning(f"获取 {current_url} 失败, 尝试下一个", e=e)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    try:
+                        return task.result()
+                    except Exception as e:
+                        last_exception = e
+                        logger.warning(f"获取 {tasks[task]} 失败", e=e)
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
 
         raise last_exception or Exception("所有URL都获取失败")
 
+    @classmethod
+    async def _get_single(
+        cls,
+        url: str,
+        check_status_code: int | None,
+        client_kwargs: dict,
+        kwargs: dict,
+    ) -> Response:
+        """对单个URL发送GET请求并校验状态码"""
+        logger.info(f"开始获取 {url}..")
+        async with cls._borrow_client(**client_kwargs) as client:
+            response = await client.get(url, **kwargs)
+        if check_status_code and response.status_code != check_status_code:
+            raise HTTPStatusError(
+                f"状态码错误: {response.status_code}!={check_status_code}",
+                request=response.request,
+                response=response,
+            )
+        return response
+
     @classmethod
     async def head(cls, url: str, **kwargs) -> Response:
         """发送 HEAD 请求。
@@ -177,10 +340,8 @@ class AsyncHttpx:
         返回:
             Response: Response
         """
-        client_kwargs = {k: v for k, v in kwargs.items() if k in CLIENT_KEY}
-        for key in CLIENT_KEY:
-            kwargs.pop(key, None)
-        async with cls._create_client(**client_kwargs) as client:
+        client_kwargs = _split_client_kwargs(kwargs)
+        async with cls._borrow_client(**client_kwargs) as client:
             return await client.head(url, **kwargs)
 
     @classmethod
@@ -198,10 +359,12 @@ class AsyncHttpx:
         返回:
             Response: Response。
         """
-        client_kwargs = {k: v for k, v in kwargs.items() if k in CLIENT_KEY}
-        for key in CLIENT_KEY:
-            kwargs.pop(key, None)
-        async with cls._create_client(**client_kwargs) as client:
+        client_kwargs = _split_client_kwargs(kwargs)
+        if "json" in kwargs:
+            # 预先用ujson序列化请求体，绕过httpx内部的标准库json编码
+            kwargs["content"] = json.dumps(kwargs.pop("json")).encode()
+            kwargs.setdefault("headers", {})["Content-Type"] = "application/json"
+        async with cls._borrow_client(**client_kwargs) as client:
             return await client.post(url, **kwargs)
 
     @classmethod
@@ -254,8 +417,7 @@ class AsyncHttpx:
                 if not stream:
                     response = await cls.get(current_url, **kwargs)
                     response.raise_for_status()
-                    async with aiofiles.open(path, "wb") as f:
-                        await f.write(response.content)
+                    await asyncio.to_thread(path.write_bytes, response.content)
                 else:
                     async with cls._create_client(**kwargs) as client:
                         stream_kwargs = {
@@ -277,10 +439,31 @@ class AsyncHttpx:
                                 TransferSpeedColumn(),
                             ) as progress:
                                 task_id = progress.add_task("Download", total=total)
-                                async with aiofiles.open(path, "wb") as f:
-                                    async for chunk in response.aiter_bytes():
-                                        await f.write(chunk)
-                                        progress.update(task_id, advance=len(chunk))
+                                fd = os.open(
+                                    path,
+                                    os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+                                    0o644,
+                                )
+                                try:
+                                    buffer = bytearray()
+                                    async for chunk in response.aiter_bytes(
+                                        chunk_size=_DOWNLOAD_BUFFER_SIZE
+                                    ):
+                                        buffer += chunk
+                                        progress.update(
+                                            task_id, advance=len(chunk)
+                                        )
+                                        if len(buffer) >= _DOWNLOAD_BUFFER_SIZE:
+                                            await asyncio.to_thread(
+                                                _write_all, fd, bytes(buffer)
+                                            )
+                                            buffer.clear()
+                                    if buffer:
+                                        await asyncio.to_thread(
+                                            _write_all, fd, bytes(buffer)
+                                        )
+                                finally:
+                                    os.close(fd)
 
                 logger.info(f"下载 {current_url} 成功 -> {path.absolute()}")
                 return True
@@ -317,37 +500,43 @@ class AsyncHttpx:
         返回:
             list[bool]: 对应每个下载任务是否成功。
         """
-        if len(url_list) != len(path_list):
-            raise ValueError("URL 列表和路径列表的长度必须相等")
-
-        semaphore = asyncio.Semaphore(limit_async_number)
-
-        async def _download_with_semaphore(
-            urls_for_one_path: str | list[str], path: str | Path
-        ):
-            async with semaphore:
-                return await cls.download_file(urls_for_one_path, path, **kwargs)
+        # 固定数量的worker消费任务队列，任务对象数只与并发上限相关
+        queue: asyncio.Queue[tuple[int, str | list[str], str | Path]] = (
+            asyncio.Queue()
+        )
+        for job in enumerate(zip(url_list, path_list, strict=True)):
+            queue.put_nowait((job[0], *job[1]))
+        final_results: list[bool] = [False] * queue.qsize()
+
+        async def _worker():
+            while True:
+                try:
+                    index, url_group, path = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    final_results[index] = await cls.download_file(
+                        url_group, path, **kwargs
+                    )
+                except Exception as e:
+                    url_info = (
+                        url_group
+                        if isinstance(url_group, str)
+                        else ", ".join(url_group)
+                    )
+                    logger.error(f"并发下载任务 ({url_info}) 时发生错误", e=e)
+                finally:
+                    queue.task_done()
 
-        tasks = [
-            _download_with_semaphore(url_group, path)
-            for url_group, path in zip(url_list, path_list)
+        workers = [
+            asyncio.create_task(_worker())
+            for _ in range(min(limit_async_number, queue.qsize()))
         ]
-
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        final_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                url_info = (
-                    url_list[i]
-                    if isinstance(url_list[i], str)
-                    else ", ".join(url_list[i])
-                )
-                logger.error(f"并发下载任务 ({url_info}) 时发生错误", e=result)
-                final_results.append(False)
-            else:
-                # download_file 返回的是 bool，可以直接附加
-                final_results.append(cast(bool, result))
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for worker in workers:
+                worker.cancel()
 
         return final_results
 
@@ -366,37 +555,79 @@ class AsyncHttpx:
         """
         assert url_list
 
-        async def head_mirror(client: type[AsyncHttpx], url: str) -> dict[str, Any]:
-            begin_time = time.time()
-
-            response = await client.head(url=url, timeout=6)
-
-            elapsed_time = (time.time() - begin_time) * 1000
-            content_length = int(response.headers.get("content-length", 0))
+        loop = asyncio.get_running_loop()
 
-            return {
-                "url": url,
-                "elapsed_time": elapsed_time,
-                "content_length": content_length,
-            }
+        async def probe_mirror(url: str) -> tuple[str, float]:
+            begin_time = loop.time()
+            await cls.head(url=url, timeout=6)
+            elapsed_time = (loop.time() - begin_time) * 1000
+            return url, elapsed_time
 
         logger.debug(f"开始获取最快镜像，可能需要一段时间... | URL列表：{url_list}")
         results = await asyncio.gather(
-            *(head_mirror(cls, url) for url in url_list),
+            *(probe_mirror(url) for url in url_list),
             return_exceptions=True,
         )
-        _results: list[dict[str, Any]] = []
+        _results: list[tuple[str, float]] = []
         for result in results:
             if isinstance(result, BaseException):
                 logger.warning(f"获取镜像失败，错误：{result}")
             else:
                 logger.debug(f"获取镜像成功，结果：{result}")
                 _results.append(result)
-        _results = sorted(iter(_results), key=lambda r: r["elapsed_time"])
-        return [result["url"] for result in _results]
+        _results.sort(key=lambda r: r[1])
+        return [result[0] for result in _results]
+
+
+@nonebot.get_driver().on_shutdown
+async def _close_http_client_pool():
+    await AsyncHttpx.close_client_pool()
+    await AsyncPlaywright._drain_ctx_pool()
 
 
 class AsyncPlaywright:
+    _ctx_pool: ClassVar[OrderedDict[str, BrowserContext]] = OrderedDict()
+    """按配置复用的浏览器上下文池，避免每次截图重建上下文"""
+    _CTX_POOL_MAX: ClassVar[int] = 4
+    _ctx_pool_lock: ClassVar[asyncio.Lock] = asyncio.Lock()
+
+    @classmethod
+    async def _drain_ctx_pool(cls):
+        """关闭并清空池中的浏览器上下文，避免泄漏"""
+        async with cls._ctx_pool_lock:
+            pool, cls._ctx_pool = cls._ctx_pool, OrderedDict()
+        for ctx in pool.values():
+            with contextlib.suppress(Exception):
+                await ctx.close()
+
+    @classmethod
+    async def _get_context(
+        cls, cookies: list[dict[str, Any]] | None, kwargs: dict
+    ) -> BrowserContext:
+        """获取按配置复用的浏览器上下文，超出池容量时收回空闲上下文"""
+        key = f"{sorted(kwargs.items(), key=lambda kv: kv[0])!r}|{cookies!r}"
+        async with cls._ctx_pool_lock:
+            ctx = cls._ctx_pool.pop(key, None)
+            if ctx is None:
+                browser = await get_browser()
+                ctx = await browser.new_context(**kwargs)
+                if cookies:
+                    await ctx.add_cookies(cookies)  # type: ignore
+            cls._ctx_pool[key] = ctx
+            while len(cls._ctx_pool) > cls._CTX_POOL_MAX:
+                idle_key = next(
+                    (
+                        k
+                        for k, c in cls._ctx_pool.items()
+                        if k != key and not c.pages
+                    ),
+                    None,
+                )
+                if idle_key is None:
+                    break
+                await cls._ctx_pool.pop(idle_key).close()
+        return ctx
+
     @classmethod
     @asynccontextmanager
     async def new_page(
@@ -407,18 +638,20 @@ class AsyncPlaywright:
         参数:
             cookies: cookies
         """
-        browser = await get_browser()
-        ctx = await browser.new_context(**kwargs)
-        if cookies:
-            if isinstance(cookies, dict):
-                cookies = [cookies]
-            await ctx.add_cookies(cookies)  # type: ignore
-        page = await ctx.new_page()
+        if cookies and isinstance(cookies, dict):
+            cookies = [cookies]
+        try:
+            ctx = await cls._get_context(cookies, kwargs)  # type: ignore
+            page = await ctx.new_page()
+        except Exception:
+            # 浏览器重启会使池中上下文全部失效，关闭并清空后重建一次
+            await cls._drain_ctx_pool()
+            ctx = await cls._get_context(cookies, kwargs)  # type: ignore
+            page = await ctx.new_page()
         try:
             yield page
         finally:
             await page.close()
-            await ctx.close()
 
     @classmethod
     async def screenshot(
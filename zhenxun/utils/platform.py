@@ -1,9 +1,9 @@
 import asyncio
-from collections.abc import Awaitable, Callable
-import random
-from typing import cast
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from functools import lru_cache
+import time
+from typing import ClassVar, cast
 
-import httpx
 import nonebot
 from nonebot.adapters import Bot
 from nonebot.utils import is_coroutine_callable
@@ -23,6 +23,63 @@ from zhenxun.utils.message import MessageUtils
 
 driver = nonebot.get_driver()
 
+_platform_cache: dict[str, str] = {}
+"""bot id到平台名缓存，省去每次的适配器接口查询"""
+
+_QQ_SCOPES = frozenset(
+    scope.value for scope in SupportScope if scope.value.lower().startswith("qq")
+)
+"""QQ系scope原值集合，热路径用集合查找代替lower+startswith"""
+
+
+def _normalize_platform(scope: str) -> str:
+    """scope归一化为平台名，QQ系scope走集合查找快路径"""
+    if scope in _QQ_SCOPES:
+        return "qq"
+    lowered = scope.lower()
+    return "qq" if lowered.startswith("qq") else lowered
+
+_forward_support_cache: dict[str, bool] = {}
+"""bot id到是否支持合并转发的缓存"""
+
+
+@driver.on_bot_disconnect
+async def _evict_bot_caches(bot: Bot):
+    _platform_cache.pop(bot.self_id, None)
+    _forward_support_cache.pop(bot.self_id, None)
+
+
+_QQ_AVATAR_NUMERIC = "http://q1.qlogo.cn/g?b=qq&nk={}&s=160".format
+"""QQ数字账号头像url模板"""
+
+_QQ_AVATAR_OPENID = "https://q.qlogo.cn/qqapp/{}/{}/640".format
+"""QQ官bot openid头像url模板"""
+
+_avatar_cache: dict[tuple, tuple[float, bytes]] = {}
+"""头像字节TTL缓存，key -> (过期时间戳, 数据)"""
+
+_AVATAR_CACHE_SIZE = 1024
+_AVATAR_CACHE_TTL = 600
+_AVATAR_HEDGE = 2
+"""群头像并发对冲请求数，取最先成功的响应"""
+
+
+def _avatar_cache_get(key: tuple) -> bytes | None:
+    cached = _avatar_cache.get(key)
+    if cached and time.monotonic() < cached[0]:
+        return cached[1]
+    return None
+
+
+def _avatar_cache_put(key: tuple, data: bytes):
+    if len(_avatar_cache) >= _AVATAR_CACHE_SIZE:
+        now = time.monotonic()
+        for k in [k for k, (exp, _) in _avatar_cache.items() if exp <= now]:
+            _avatar_cache.pop(k, None)
+        while len(_avatar_cache) >= _AVATAR_CACHE_SIZE:
+            _avatar_cache.pop(next(iter(_avatar_cache)))
+    _avatar_cache[key] = (time.monotonic() + _AVATAR_CACHE_TTL, data)
+
 
 class UserData(BaseModel):
     name: str
@@ -107,24 +164,53 @@ class PlatformUtils:
                 raise NotFindSuperuser()
         if isinstance(message, str):
             message = MessageUtils.build_message(message)
+        # 各超级用户发送互不依赖，并发执行避免串行等待
+        send_results = await asyncio.gather(
+            *(cls.send_message(bot, sid, None, message) for sid in superuser_ids),
+            return_exceptions=True,
+        )
         result = []
-        for superuser_id in superuser_ids:
-            try:
-                result.append(
-                    (
-                        superuser_id,
-                        await cls.send_message(bot, superuser_id, None, message),
-                    )
-                )
-            except Exception as e:
+        for sid, receipt in zip(superuser_ids, send_results):
+            if isinstance(receipt, BaseException):
                 logger.error(
                     "发送消息给超级用户失败",
                     "PlatformUtils:send_superuser",
-                    target=superuser_id,
-                    e=e,
+                    target=sid,
+                    e=receipt,
                 )
+            else:
+                result.append((sid, receipt))
         return result
 
+    @classmethod
+    async def iter_group_members(
+        cls, bot: Bot, group_id: str
+    ) -> AsyncGenerator[UserData, None]:
+        """逐个产出群组/频道成员，避免为大群一次性构建完整列表
+
+        参数:
+            bot: Bot
+            group_id: 群组/频道id
+        """
+        if not (interface := get_interface(bot)):
+            return
+        members: list[Member] = await interface.get_members(SceneType.GROUP, group_id)
+        # 数据来自适配器接口，用 model_construct 跳过逐成员的校验开销
+        build = UserData.model_construct
+        for member in members:
+            yield build(
+                name=member.user.name or "",
+                card=member.nick,
+                user_id=member.user.id,
+                group_id=group_id,
+                channel_id=None,
+                role=member.role.id if member.role else "",
+                avatar_url=member.user.avatar,
+                join_time=int(member.joined_at.timestamp())
+                if member.joined_at
+                else None,
+            )
+
     @classmethod
     async def get_group_member_list(cls, bot: Bot, group_id: str) -> list[UserData]:
         """获取群组/频道成员列表
@@ -136,25 +222,7 @@ class PlatformUtils:
         返回:
             list[UserData]: 用户数据列表
         """
-        if interface := get_interface(bot):
-            members: list[Member] = await interface.get_members(
-                SceneType.GROUP, group_id
-            )
-            return [
-                UserData(
-                    name=member.user.name or "",
-                    card=member.nick,
-                    user_id=member.user.id,
-                    group_id=group_id,
-                    role=member.role.id if member.role else "",
-                    avatar_url=member.user.avatar,
-                    join_time=int(member.joined_at.timestamp())
-                    if member.joined_at
-                    else None,
-                )
-                for member in members
-            ]
-        return []
+        return [user async for user in cls.iter_group_members(bot, group_id)]
 
     @classmethod
     async def get_user(
@@ -216,21 +284,34 @@ class PlatformUtils:
 
     @classmethod
     async def get_user_avatar(
-        cls, user_id: str, platform: str, appid: str | None = None
+        cls,
+        user_id: str,
+        platform: str,
+        appid: str | None = None,
+        bypass_cache: bool = False,
     ) -> bytes | None:
         """快捷获取用户头像
 
         参数:
             user_id: 用户id
             platform: 平台
+            appid: appid.
+            bypass_cache: 跳过缓存强制刷新.
         """
-        url = None
-        if platform == "qq":
-            if user_id.isdigit():
-                url = f"http://q1.qlogo.cn/g?b=qq&nk={user_id}&s=160"
-            else:
-                url = f"https://q.qlogo.cn/qqapp/{appid}/{user_id}/640"
-        return await AsyncHttpx.get_content(url) if url else None
+        if platform != "qq":
+            return None
+        url = (
+            _QQ_AVATAR_NUMERIC(user_id)
+            if user_id.isdigit()
+            else _QQ_AVATAR_OPENID(appid, user_id)
+        )
+        key = ("user", user_id, appid)
+        if not bypass_cache and (cached := _avatar_cache_get(key)):
+            return cached
+        data = await AsyncHttpx.get_content(url)
+        if data:
+            _avatar_cache_put(key, data)
+        return data
 
     @classmethod
     def get_user_avatar_url(
@@ -245,28 +326,55 @@ class PlatformUtils:
         if platform != "qq":
             return None
         if user_id.isdigit():
-            return f"http://q1.qlogo.cn/g?b=qq&nk={user_id}&s=160"
-        else:
-            return f"https://q.qlogo.cn/qqapp/{appid}/{user_id}/640"
+            return _QQ_AVATAR_NUMERIC(user_id)
+        return _QQ_AVATAR_OPENID(appid, user_id)
 
     @classmethod
-    async def get_group_avatar(cls, gid: str, platform: str) -> bytes | None:
+    async def get_group_avatar(
+        cls, gid: str, platform: str, bypass_cache: bool = False
+    ) -> bytes | None:
         """快捷获取用群头像
 
         参数:
             gid: 群组id
             platform: 平台
+            bypass_cache: 跳过缓存强制刷新.
         """
         if platform == "qq":
+            key = ("group", gid)
+            if not bypass_cache and (cached := _avatar_cache_get(key)):
+                return cached
             url = f"http://p.qlogo.cn/gh/{gid}/{gid}/640/"
-            async with httpx.AsyncClient() as client:
-                for _ in range(3):
-                    try:
-                        return (await client.get(url)).content
-                    except Exception:
-                        logger.error(
-                            "获取群头像错误", "Util", target=gid, platform=platform
-                        )
+            # 对冲请求：并发发起多次获取，取最先成功者并取消其余，压尾延迟
+            pending: set[asyncio.Task] = {
+                asyncio.create_task(AsyncHttpx.get_content(url))
+                for _ in range(_AVATAR_HEDGE)
+            }
+            try:
+                while pending:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        try:
+                            data = task.result()
+                        except Exception as e:
+                            logger.error(
+                                "获取群头像错误",
+                                "Util",
+                                target=gid,
+                                platform=platform,
+                                e=e,
+                            )
+                            continue
+                        if data:
+                            _avatar_cache_put(key, data)
+                        return data
+            finally:
+                for task in pending:
+                    task.cancel()
+                if pending:
+                    await asyncio.gather(*pending, return_exceptions=True)
         return None
 
     @classmethod
@@ -311,13 +419,18 @@ class PlatformUtils:
         update_list = []
         group_list, platform = await cls.get_group_list(bot)
         if group_list:
-            db_group = await GroupConsole.all()
-            db_group_id: list[tuple[str, str]] = [
-                (group.group_id, group.channel_id) for group in db_group
-            ]
+            # unique_together 中 channel_id 可空，NULL 不参与 ON CONFLICT 判定，
+            # 无法用 bulk_create(on_conflict=...) 一次性 upsert，仍分类后批量写入
+            db_group = await GroupConsole.all().only(
+                "id", "group_id", "channel_id"
+            )
+            db_index = {
+                (group.group_id, group.channel_id): group for group in db_group
+            }
             for group in group_list:
                 group.platform = platform
-                if (group.group_id, group.channel_id) not in db_group_id:
+                _group = db_index.get((group.group_id, group.channel_id))
+                if _group is None:
                     create_list.append(group)
                     logger.debug(
                         "群聊信息更新成功",
@@ -325,21 +438,15 @@ class PlatformUtils:
                         target=f"{group.group_id}:{group.channel_id}",
                     )
                 else:
-                    _group = next(
-                        g
-                        for g in db_group
-                        if g.group_id == group.group_id
-                        and g.channel_id == group.channel_id
-                    )
                     _group.group_name = group.group_name
                     _group.max_member_count = group.max_member_count
                     _group.member_count = group.member_count
                     update_list.append(_group)
         if create_list:
-            await GroupConsole.bulk_create(create_list, 10)
+            await GroupConsole.bulk_create(create_list, 500)
         if group_list:
             await GroupConsole.bulk_update(
-                update_list, ["group_name", "max_member_count", "member_count"], 10
+                update_list, ["group_name", "max_member_count", "member_count"], 500
             )
         return len(create_list)
 
@@ -354,13 +461,16 @@ class PlatformUtils:
             str | None: 平台
         """
         if isinstance(t, Bot):
+            platform = _platform_cache.get(t.self_id)
+            if platform is not None:
+                return platform
             if interface := get_interface(t):
                 info = interface.basic_info()
-                platform = info["scope"].lower()
-                return "qq" if platform.startswith("qq") else platform
+                platform = _normalize_platform(info["scope"])
+                _platform_cache[t.self_id] = platform
+                return platform
         else:
-            platform = t.basic["scope"].lower()
-            return "qq" if platform.startswith("qq") else platform
+            return _normalize_platform(t.basic["scope"])
         return "unknown"
 
     @classmethod
@@ -375,9 +485,14 @@ class PlatformUtils:
         """
         if not isinstance(t, Bot):
             return t.basic["scope"] == SupportScope.qq_client
+        supported = _forward_support_cache.get(t.self_id)
+        if supported is not None:
+            return supported
         if interface := get_interface(t):
             info = interface.basic_info()
-            return info["scope"] == SupportScope.qq_client
+            supported = info["scope"] == SupportScope.qq_client
+            _forward_support_cache[t.self_id] = supported
+            return supported
         return False
 
     @classmethod
@@ -398,24 +513,36 @@ class PlatformUtils:
         platform = cls.get_platform(bot)
         result_list = []
         scenes = await interface.get_scenes(SceneType.GROUP)
-        for scene in scenes:
-            group_id = scene.id
+        fetch_channel = not only_group and platform != "qq"
+        channel_results = (
+            await asyncio.gather(
+                *[interface.get_scenes(parent_scene_id=scene.id) for scene in scenes],
+                return_exceptions=True,
+            )
+            if fetch_channel
+            else [None] * len(scenes)
+        )
+        for scene, channel_list in zip(scenes, channel_results):
             result_list.append(
                 GroupConsole(
                     group_id=scene.id,
                     group_name=scene.name,
                 )
             )
-            if not only_group and platform != "qq":
-                if channel_list := await interface.get_scenes(parent_scene_id=group_id):
-                    result_list.extend(
-                        GroupConsole(
-                            group_id=scene.id,
-                            group_name=channel.name,
-                            channel_id=channel.id,
-                        )
-                        for channel in channel_list
+            if isinstance(channel_list, BaseException):
+                logger.warning(
+                    "获取子频道列表失败", "更新群信息", target=scene.id, e=channel_list
+                )
+                continue
+            if channel_list:
+                result_list.extend(
+                    GroupConsole(
+                        group_id=scene.id,
+                        group_name=channel.name,
+                        channel_id=channel.id,
                     )
+                    for channel in channel_list
+                )
         return result_list, platform
 
     @classmethod
@@ -428,17 +555,19 @@ class PlatformUtils:
         返回:
             int: 更新个数
         """
-        create_list = []
         friend_list, platform = await cls.get_friend_list(bot)
-        if friend_list:
-            user_id_list = await FriendUser.all().values_list("user_id", flat=True)
-            for friend in friend_list:
-                friend.platform = platform
-                if friend.user_id not in user_id_list:
-                    create_list.append(friend)
-        if create_list:
-            await FriendUser.bulk_create(create_list, 10)
-        return len(create_list)
+        if not friend_list:
+            return 0
+        exists_ids = set(await FriendUser.all().values_list("user_id", flat=True))
+        for friend in friend_list:
+            friend.platform = platform
+        await FriendUser.bulk_create(
+            friend_list,
+            500,
+            on_conflict=["user_id"],
+            update_fields=["user_name"],
+        )
+        return sum(1 for friend in friend_list if friend.user_id not in exists_ids)
 
     @classmethod
     async def get_friend_list(cls, bot: Bot) -> tuple[list[FriendUser], str]:
@@ -457,6 +586,21 @@ class PlatformUtils:
             ], cls.get_platform(bot)
         return [], ""
 
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _build_target(
+        user_id: str | None, group_id: str | None, channel_id: str | None
+    ) -> Target | None:
+        """按参数构建并缓存Target，Target仅由id决定，可安全复用"""
+        target = None
+        if group_id and channel_id:
+            target = Target(channel_id, parent_id=group_id, channel=True)
+        elif group_id:
+            target = Target(group_id)
+        elif user_id:
+            target = Target(user_id, private=True)
+        return target
+
     @classmethod
     def get_target(
         cls,
@@ -476,23 +620,25 @@ class PlatformUtils:
         返回:
             target: 对应平台Target
         """
-        target = None
-        if group_id and channel_id:
-            target = Target(channel_id, parent_id=group_id, channel=True)
-        elif group_id:
-            target = Target(group_id)
-        elif user_id:
-            target = Target(user_id, private=True)
-        return target
+        return cls._build_target(user_id, group_id, channel_id)
 
 
 class BroadcastEngine:
+    CONCURRENCY: ClassVar[int] = 5
+    """单个Bot内群组发送并发上限"""
+
+    SEND_RATE: ClassVar[float] = 0.5
+    """每秒补充的发送令牌数，对应原平均2秒一条的随机间隔"""
+
+    SEND_BURST: ClassVar[int] = 3
+    """发送令牌桶容量"""
+
     def __init__(
         self,
         message: str | UniMessage,
         bot: Bot | list[Bot] | None = None,
         bot_id: str | set[str] | None = None,
-        ignore_group: list[str] | None = None,
+        ignore_group: Iterable[str] | None = None,
         check_func: Callable[[Bot, str], Awaitable] | None = None,
         log_cmd: str | None = None,
         platform: str | None = None,
@@ -511,21 +657,25 @@ class BroadcastEngine:
         异常:
             ValueError: 没有可用的Bot对象
         """
-        if ignore_group is None:
-            ignore_group = []
         self.message = MessageUtils.build_message(message)
-        self.ignore_group = ignore_group
+        self.ignore_group: set[str] = set(ignore_group or ())
         self.check_func = check_func
         self.log_cmd = log_cmd
         self.platform = platform
         self.bot_list = []
         self.count = 0
+        self._tokens = float(self.SEND_BURST)
+        self._last_refill = 0.0
+        self._throttle_lock = asyncio.Lock()
         if bot:
             self.bot_list = [bot] if isinstance(bot, Bot) else bot
         if isinstance(bot_id, str):
-            bot_id = set(bot_id)
+            bot_id = {bot_id}
         if bot_id:
+            exists_ids = {b.self_id for b in self.bot_list}
             for i in bot_id:
+                if i in exists_ids:
+                    continue
                 try:
                     self.bot_list.append(nonebot.get_bot(i))
                 except KeyError:
@@ -533,6 +683,21 @@ class BroadcastEngine:
         if not self.bot_list:
             raise ValueError("当前没有可用的Bot对象...", log_cmd)
 
+    async def _acquire_send_token(self):
+        """按令牌桶限速，维持平均发送速率而非逐条随机延迟"""
+        async with self._throttle_lock:
+            now = time.monotonic()
+            self._tokens = min(
+                float(self.SEND_BURST),
+                self._tokens + (now - self._last_refill) * self.SEND_RATE,
+            )
+            self._last_refill = now
+            if self._tokens < 1.0:
+                await asyncio.sleep((1.0 - self._tokens) / self.SEND_RATE)
+                self._last_refill = time.monotonic()
+                self._tokens = 1.0
+            self._tokens -= 1.0
+
     async def call_check(self, bot: Bot, group_id: str) -> bool:
         """运行发送检测函数
 
@@ -570,38 +735,68 @@ class BroadcastEngine:
             group_id=group.group_id,
             channel_id=group.channel_id,
         ):
-            self.ignore_group.append(key)
-            await MessageUtils.build_message(self.message).send(target, bot)
+            self.ignore_group.add(key)
+            await self.message.send(target, bot)
             logger.debug("广播消息发送成功...", self.log_cmd, target=key)
         else:
             logger.warning("广播消息获取Target失败...", self.log_cmd, target=key)
 
-    async def broadcast(self) -> int:
-        """广播消息
+    async def _broadcast_one_bot(self, bot: Bot) -> int:
+        """向单个Bot的所有群组广播
+
+        参数:
+            bot: Bot
 
         返回:
             int: 成功发送次数
         """
-        for bot in self.bot_list:
-            if self.platform and self.platform != PlatformUtils.get_platform(bot):
-                continue
-            group_list, _ = await PlatformUtils.get_group_list(bot)
-            if not group_list:
-                continue
-            for group in group_list:
-                if (
-                    group.group_id in self.ignore_group
-                    or group.channel_id in self.ignore_group
-                ):
-                    continue
+        if self.platform and self.platform != PlatformUtils.get_platform(bot):
+            return 0
+        group_list, _ = await PlatformUtils.get_group_list(bot)
+        if not group_list:
+            return 0
+        semaphore = asyncio.Semaphore(self.CONCURRENCY)
+
+        async def _send(group: GroupConsole) -> int:
+            async with semaphore:
                 try:
+                    await self._acquire_send_token()
                     await self.__send_message(bot, group)
-                    await asyncio.sleep(random.randint(1, 3))
-                    self.count += 1
+                    return 1
                 except Exception as e:
                     logger.warning(
                         "广播消息发送失败", self.log_cmd, target=group.group_id, e=e
                     )
+                    return 0
+
+        results = await asyncio.gather(
+            *(
+                _send(group)
+                for group in group_list
+                if group.group_id not in self.ignore_group
+                and (
+                    not group.channel_id
+                    or group.channel_id not in self.ignore_group
+                )
+            )
+        )
+        return sum(results)
+
+    async def broadcast(self) -> int:
+        """广播消息，各Bot并发发送
+
+        返回:
+            int: 成功发送次数
+        """
+        per_bot_counts = await asyncio.gather(
+            *(self._broadcast_one_bot(bot) for bot in self.bot_list),
+            return_exceptions=True,
+        )
+        for result in per_bot_counts:
+            if isinstance(result, BaseException):
+                logger.warning(f"广播Bot发送失败，错误：{result}", self.log_cmd)
+            else:
+                self.count += result
         return self.count
 
 
@@ -609,7 +804,7 @@ async def broadcast_group(
     message: str | UniMessage,
     bot: Bot | list[Bot] | None = None,
     bot_id: str | set[str] | None = None,
-    ignore_group: list[str] = [],
+    ignore_group: Iterable[str] | None = None,
     check_func: Callable[[Bot, str], Awaitable] | None = None,
     log_cmd: str | None = None,
     platform: str | None = None,